@@ -0,0 +1,195 @@
+import importlib
+import json
+import os
+from io import BytesIO, StringIO
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Lazy Imports
+# Apps bind heavy dependencies (plotly, reportlab, requests, XML) to LazyModule so they load on
+# first use, and the first paint does not wait for them
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access"""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+ET = LazyModule("xml.etree.ElementTree")
+requests = LazyModule("requests")
+
+# Reference Data
+# Parsed once per process and shared by every session. Sessions get a shallow copy over
+# read-only arrays: columns they add or replace stay on their copy, and an in-place write
+# raises (or copies, under pandas copy-on-write) instead of changing every session's data
+def read_only_frame(data_frame):
+    """Frame over copies of the columns, with the NumPy arrays marked read-only"""
+    columns = {}
+    for name, column in data_frame.items():
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy(copy=True)
+            values.flags.writeable = False
+            columns[name] = values
+        else:
+            columns[name] = column.array.copy()
+    return pd.DataFrame(columns, index=data_frame.index, copy=False)
+
+@st.cache_resource
+def fetch_github_csv(url):
+    response = requests.get(url)
+    response.raise_for_status()
+    return read_only_frame(pd.read_csv(StringIO(response.content.decode('utf-8'))))
+
+def load_github_csv(url):
+    return fetch_github_csv(url).copy(deep=False)
+
+# Uploaded Files
+def parse_xml_upload(content):
+    root = ET.parse(BytesIO(content)).getroot()
+    return pd.DataFrame([{child.tag: child.text for child in element} for element in root])
+
+UPLOAD_PARSERS = {
+    "csv": lambda content: pd.read_csv(BytesIO(content)),
+    "json": lambda content: pd.DataFrame(json.loads(content)),
+    "xml": parse_xml_upload
+}
+
+# Keyed on the upload's file_id, so a rerun reuses the parsed frame instead of hashing or re-reading the bytes
+@st.cache_data(max_entries=8, show_spinner=False)
+def read_uploaded_file(file_id, file_extension, _content):
+    return UPLOAD_PARSERS[file_extension](_content)
+
+def parse_uploaded_file(file):
+    """Parse an uploaded CSV, JSON or XML file into a DataFrame, reporting the result in the sidebar"""
+    if file is None:
+        return None
+    file_extension = file.name.split('.')[-1].lower()
+    if file_extension not in UPLOAD_PARSERS:
+        st.sidebar.error("Unsupported file format")
+        return None
+    try:
+        data_frame = read_uploaded_file(file.file_id, file_extension, file.getvalue())
+    except Exception as e:
+        st.sidebar.error(f"Failed to load file: {e}")
+        return None
+    st.sidebar.success(f"{file_extension.upper()} file loaded successfully")
+    return data_frame
+
+# Regulation Entry
+def parse_regulations(pasted_text, csv_file):
+    """Regulations from pasted lines and from the first (or "Regulation") column of a CSV file"""
+    regulations = [line.strip() for line in pasted_text.splitlines() if line.strip()]
+    if csv_file is not None:
+        imported = pd.read_csv(csv_file)
+        column = "Regulation" if "Regulation" in imported.columns else imported.columns[0]
+        regulations += [value.strip() for value in imported[column].dropna().astype(str) if value.strip()]
+    return regulations
+
+def set_regulations(regulations):
+    """Replace the regulations table; the editor gets a new key so stale edits are dropped"""
+    st.session_state.regulations_table = pd.DataFrame({"Regulation": regulations}, dtype="object")
+    st.session_state.regulations_version = st.session_state.get('regulations_version', 0) + 1
+
+def import_regulations():
+    """Add the pasted and uploaded regulations to the table, then clear the paste box"""
+    imported = parse_regulations(st.session_state.regulations_paste, st.session_state.regulations_csv)
+    current = [] if st.session_state.regulations_replace else st.session_state.get('regulations', [])
+    set_regulations(current + imported)
+    st.session_state.regulations_paste = ""
+
+def regulations_import():
+    """Bulk paste and CSV import for the regulations table"""
+    with st.expander("Paste or import regulations"):
+        st.text_area("One regulation per line", key="regulations_paste")
+        st.file_uploader("CSV file (first column, or a column named Regulation)", type=["csv"], key="regulations_csv")
+        st.checkbox("Replace the current regulations", key="regulations_replace")
+        st.button("Add Regulations", on_click=import_regulations)
+
+def regulations_editor(default_regulations):
+    """One editable table instead of a text input per regulation; returns its non-empty rows"""
+    if 'regulations_table' not in st.session_state:
+        set_regulations(default_regulations)
+    edited = st.data_editor(
+        st.session_state.regulations_table,
+        key=f"regulations_editor_{st.session_state.regulations_version}",
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        column_config={"Regulation": st.column_config.TextColumn("Regulation")}
+    )
+    regulations = [value.strip() for value in edited["Regulation"].dropna().astype(str) if value.strip()]
+    st.session_state.regulations = regulations
+    return regulations
+
+# Data Preview
+# Only the visible page is sent to the browser; filtering and sorting run on the server
+PREVIEW_PAGE_SIZES = [25, 50, 100, 500]
+PREVIEW_MAX_BYTES = int(os.environ.get("PREVIEW_MAX_BYTES", 2 * 1024 * 1024))
+
+def preview_positions(data_frame, dataset_key, filter_column, filter_text, sort_column, descending):
+    """Row positions that match the filter, in sort order, reused until the view changes"""
+    view_key = (dataset_key, filter_column, filter_text, sort_column, descending)
+    cached = st.session_state.get('preview_view')
+    if cached is not None and cached[0] == view_key:
+        return cached[1]
+
+    positions = np.arange(len(data_frame))
+    if filter_text:
+        matches = data_frame[filter_column].astype(str).str.contains(filter_text, case=False, regex=False)
+        positions = positions[matches.to_numpy()]
+    if sort_column is not None:
+        values = data_frame[sort_column].take(positions).reset_index(drop=True)
+        order = values.sort_values(ascending=not descending, kind="stable", na_position="last").index
+        positions = positions[order.to_numpy()]
+
+    st.session_state.preview_view = (view_key, positions)
+    return positions
+
+def cap_preview_payload(page_frame):
+    """Trim trailing rows until the page fits in PREVIEW_MAX_BYTES"""
+    size = int(page_frame.memory_usage(deep=True).sum())
+    if size <= PREVIEW_MAX_BYTES or len(page_frame) <= 1:
+        return page_frame
+    keep = max(1, len(page_frame) * PREVIEW_MAX_BYTES // size)
+    return page_frame.iloc[:keep]
+
+def show_data_preview(data_frame, dataset_key):
+    """Filter, sort and page through the loaded frame"""
+    st.write("Loaded Data Preview:")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        filter_column = st.selectbox("Filter column", data_frame.columns, key="preview_filter_column")
+    with col2:
+        filter_text = st.text_input("Contains", key="preview_filter_text")
+    with col3:
+        sort_column = st.selectbox(
+            "Sort by",
+            [None, *data_frame.columns],
+            format_func=lambda column: "Original order" if column is None else str(column),
+            key="preview_sort_column"
+        )
+    with col4:
+        descending = st.checkbox("Descending", key="preview_descending")
+
+    positions = preview_positions(data_frame, dataset_key, filter_column, filter_text, sort_column, descending)
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox("Rows per page", PREVIEW_PAGE_SIZES, index=1, key="preview_page_size")
+    with col2:
+        page_count = max(1, -(-len(positions) // page_size))
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="preview_page")
+
+    start = (page - 1) * page_size
+    page_frame = data_frame.iloc[positions[start:start + page_size]]
+    shown = cap_preview_payload(page_frame)
+    st.dataframe(shown)
+    caption = f"Rows {min(start + 1, len(positions)):,}-{start + len(shown):,} of {len(positions):,} matching ({len(data_frame):,} total)"
+    if len(shown) < len(page_frame):
+        caption += f"; page trimmed to {len(shown):,} rows to stay under {PREVIEW_MAX_BYTES / 1024 / 1024:.1f} MiB, choose fewer rows per page to see the rest"
+    st.caption(caption)
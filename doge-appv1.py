@@ -1,28 +1,15 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import altair as alt
 import json
-import xml.etree.ElementTree as ET
 from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-
-# Function to calculate efficiency score
-def calculate_efficiency_score(employees, budget, utilization, oversight, num_regulations, economic_oversight, effectiveness_score):
-    score = (
-        (utilization * 0.3) +
-        ((100 - oversight) * 0.2) +
-        (min(2000 / employees, 100) * 0.2) +
-        (max(100 - num_regulations * 2, 0) * 0.15) +
-        (100 - economic_oversight * 0.15) +
-        (effectiveness_score * 0.5)
-    )
-    return min(score / 1.5, 100)
-
-# Calculate qualitative effectiveness score
-def calculate_effectiveness_score(communication, transparency, responsiveness, policy_impact, citizen_satisfaction):
-    return (communication + transparency + responsiveness + policy_impact + citizen_satisfaction) / 5 * 20
+from app_common import LazyModule, regulations_editor, regulations_import
+from scoring import calculate_efficiency_score, calculate_effectiveness_score
+
+# Lazy Imports
+ET = LazyModule("xml.etree.ElementTree")
+pagesizes = LazyModule("reportlab.lib.pagesizes")
+canvas = LazyModule("reportlab.pdfgen.canvas")
 
 # Convert input data to CSV
 def convert_to_csv(data):
@@ -43,7 +30,7 @@ def convert_to_xml(data):
 # Convert input data to PDF
 def convert_to_pdf(data):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
+    p = canvas.Canvas(buffer, pagesize=pagesizes.letter)
     p.setFont("Helvetica", 12)
     text = f"Department Efficiency Report\n\n"
     y_position = 750
@@ -70,12 +57,10 @@ def input_detailed_data():
     
     # Governing Regulations
     st.subheader("Governing Regulations in Place Today")
-    regulations = []
-    num_regulations = st.number_input("How many regulations does this department currently enforce?", min_value=0, value=3)
-    
-    for i in range(num_regulations):
-        regulation = st.text_input(f"Regulation {i + 1}", value=f"Regulation {i + 1}")
-        regulations.append(regulation)
+    regulations = regulations_editor(["Regulation 1", "Regulation 2", "Regulation 3"])
+    num_regulations = len(regulations)
+    st.caption(f"{num_regulations} regulations")
+    regulations_import()
     
     # Budget and Oversight
     budget = st.number_input("Annual Budget (in Million USD)", min_value=0.0, value=100.0)
@@ -1,7 +1,10 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from app_common import LazyModule
+
+# Lazy Imports
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
 
 # Set page config
 st.set_page_config(page_title="Business Efficiency Calculator", layout="wide")
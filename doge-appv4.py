@@ -1,10 +1,21 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 import json
-from datetime import datetime
+import os
+import sqlite3
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+import threading
 import uuid
+from app_common import LazyModule
+from scoring import calculate_category_score, calculate_overall_efficiency
+
+# Lazy Imports
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
 
 # Configuration and Page Setup
 st.set_page_config(
@@ -35,12 +46,13 @@ st.markdown("""
 # Initialize Session State
 def init_session_state():
     if 'history' not in st.session_state:
-        st.session_state.history = []
+        st.session_state.history = HistoryColumns()
+    # (company, first date, last date) of the assessments loaded into history
+    if 'history_key' not in st.session_state:
+        st.session_state.history_key = None
     if 'current_assessment_id' not in st.session_state:
         st.session_state.current_assessment_id = str(uuid.uuid4())
 
-init_session_state()
-
 # Data Models
 EFFICIENCY_CATEGORIES = {
     "Operational Efficiency": {
@@ -118,12 +130,6 @@ EFFICIENCY_CATEGORIES = {
 }
 
 # Utility Functions
-def calculate_category_score(metrics):
-    return sum(metrics.values())
-
-def calculate_overall_efficiency(category_scores):
-    return sum(category_scores.values()) / len(category_scores)
-
 def generate_recommendations(category_scores):
     recommendations = []
     priority_levels = {
@@ -146,30 +152,553 @@ def generate_recommendations(category_scores):
     
     return sorted(recommendations, key=lambda x: x["score"])
 
-# Main Application
-def main():
-    st.title("🎯 Business Efficiency Analytics Dashboard")
-    st.markdown("---")
+# Chart Functions
+CHART_CACHE_ENTRIES = 256
 
-    # Sidebar
-    with st.sidebar:
-        st.header("Assessment Controls")
-        company_name = st.text_input("Company Name", "My Company")
-        assessment_date = st.date_input("Assessment Date", datetime.now())
-        st.markdown("---")
-        st.markdown("### Instructions")
-        st.markdown("""
-        1. Rate each metric from 0-25
-        2. Review the visualizations
-        3. Export your results
-        4. Track progress over time
-        """)
+@st.cache_resource
+def get_chart_templates():
+    """Radar and bar figures with zero scores, built once; px.bar only runs here"""
+    categories = list(EFFICIENCY_CATEGORIES)
+    fig_radar = go.Figure(data=go.Scatterpolar(
+        r=[0] * len(categories),
+        theta=categories,
+        fill='toself',
+        name='Current Assessment'
+    ))
+    fig_radar.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        showlegend=True,
+        title="Efficiency Radar Chart"
+    )
 
-    # Main Content
-    tab1, tab2, tab3 = st.tabs(["Assessment", "Visualizations", "History"])
+    df_metrics = pd.DataFrame([
+        {"Category": category, "Metric": metric, "Value": 0}
+        for category, metrics in EFFICIENCY_CATEGORIES.items()
+        for metric in metrics
+    ])
+    fig_bar = px.bar(
+        df_metrics,
+        x="Value",
+        y="Metric",
+        color="Category",
+        title="Detailed Metrics Breakdown",
+        orientation='h'
+    )
+    fig_bar.update_layout(yaxis={'categoryorder':'total ascending'})
+    return fig_radar, fig_bar
 
-    # Tab 1: Assessment
-    with tab1:
+@st.cache_resource(max_entries=CHART_CACHE_ENTRIES)
+def build_charts(category_values, metric_values):
+    """Copy the templates and fill in trace data; figures are shared by every rerun with the same scores"""
+    radar_template, bar_template = get_chart_templates()
+    fig_radar = go.Figure(radar_template)
+    fig_radar.data[0].r = category_values
+    fig_bar = go.Figure(bar_template)
+    # px.bar draws one trace per category, named after it
+    values_by_category = dict(metric_values)
+    for trace in fig_bar.data:
+        trace.x = values_by_category[trace.name]
+    return fig_radar, fig_bar
+
+# Large History Charts
+# Raw history points are LTTB-downsampled to fit the byte budget, and drawn with WebGL when many remain
+CHART_BYTE_BUDGET = int(os.environ.get("CHART_BYTE_BUDGET", 256 * 1024))
+CHART_BYTES_PER_POINT = 48  # An ISO timestamp, a float and separators in the figure JSON
+WEBGL_POINTS = 1000
+
+def lttb_indices(x, y, threshold):
+    """Largest-Triangle-Three-Buckets: positions of `threshold` points that keep the series' shape"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # First and last points are kept; the rest is split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    buckets = threshold - 2
+    # Mean of every bucket and of the last point in one pass: the "next bucket" of each step
+    counts = np.diff(np.append(edges, n))
+    next_x = (np.add.reduceat(x, edges) / counts)[1:]
+    next_y = (np.add.reduceat(y, edges) / counts)[1:]
+    # Buckets as rows of one matrix, short rows padded with their first point
+    width = int(counts[:buckets].max())
+    positions = edges[:buckets, None] + np.arange(width)
+    positions = np.where(positions < edges[1:, None], positions, edges[:buckets, None])
+    bucket_x, bucket_y = x[positions], y[positions]
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    # Each bucket depends on the point kept in the one before, so only this step stays a loop
+    for i in range(buckets):
+        selected_x, selected_y = x[selected], y[selected]
+        # Keep the point forming the largest triangle with the last kept point and the next bucket's mean
+        areas = np.abs(
+            (selected_x - next_x[i]) * (bucket_y[i] - selected_y)
+            - (selected_x - bucket_x[i]) * (next_y[i] - selected_y)
+        )
+        selected = positions[i, areas.argmax()]
+        indices[i + 1] = selected
+    return indices
+
+# Cached per chart so reruns that only touch other widgets skip the downsampling. The key
+# names the data: company, date range, score and assessment count (saves only append)
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_lttb_indices(chart_key, _x, _y, threshold):
+    return lttb_indices(_x, _y, threshold)
+
+def build_history_figure(series, chart_key=None):
+    """Line chart of a date-indexed score series within CHART_BYTE_BUDGET; downsampling is
+    cached when a chart_key identifying the series is given"""
+    series = series.sort_index()
+    dates = series.index.to_numpy()
+    values = series.to_numpy(dtype=np.float64)
+    max_points = max(3, CHART_BYTE_BUDGET // CHART_BYTES_PER_POINT)
+    if len(values) > max_points:
+        x = dates.astype(np.int64).astype(np.float64)
+        if chart_key is None:
+            keep = lttb_indices(x, values, max_points)
+        else:
+            keep = cached_lttb_indices((*chart_key, len(values)), x, values, max_points)
+        dates, values = dates[keep], values[keep]
+
+    trace = go.Scattergl if len(values) > WEBGL_POINTS else go.Scatter
+    fig = go.Figure(trace(x=dates, y=values, mode="lines", name=series.name))
+    fig.update_layout(
+        title=f"{series.name} ({len(values):,} of {len(series):,} points)",
+        yaxis=dict(range=[0, 100])
+    )
+    return fig
+
+# Session Snapshot Format
+# Header: magic, format version, scores per assessment, number of assessments.
+# Body: one float64 vector per assessment (overall, category scores, metric scores in
+# EFFICIENCY_CATEGORIES order) followed by a length-prefixed metadata block holding the
+# id, company name and date of each assessment as length-prefixed UTF-8 strings.
+# Version 1 files (float32 scores, separator-delimited metadata) can still be restored.
+SNAPSHOT_MAGIC = b"DOGE"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_HEADER = struct.Struct("<4sHHI")
+SNAPSHOT_BLOCK_LENGTH = struct.Struct("<I")
+SNAPSHOT_STRING_LENGTH = struct.Struct("<I")
+SNAPSHOT_SCORE_TYPES = {1: "f", 2: "d"}
+SNAPSHOT_V1_FIELD_SEPARATOR = "\x1f"
+SNAPSHOT_V1_RECORD_SEPARATOR = "\x1e"
+
+def snapshot_vector_length():
+    return 1 + len(EFFICIENCY_CATEGORIES) + sum(len(metrics) for metrics in EFFICIENCY_CATEGORIES.values())
+
+def pack_snapshot_strings(values):
+    encoded = [value.encode("utf-8") for value in values]
+    return b"".join(SNAPSHOT_STRING_LENGTH.pack(len(value)) + value for value in encoded)
+
+def unpack_snapshot_strings(block, count):
+    strings = []
+    offset = 0
+    for _ in range(count):
+        (length,) = SNAPSHOT_STRING_LENGTH.unpack_from(block, offset)
+        offset += SNAPSHOT_STRING_LENGTH.size
+        if offset + length > len(block):
+            raise ValueError("Truncated snapshot metadata")
+        strings.append(block[offset:offset + length].decode("utf-8"))
+        offset += length
+    return strings
+
+def save_snapshot(history):
+    """Pack HistoryColumns into the binary snapshot format, a column at a time"""
+    n = len(history)
+    columns = [history.overall] + [history.categories[category] for category in EFFICIENCY_CATEGORIES] + [
+        history.metrics[(category, metric)] for category, metrics in EFFICIENCY_CATEGORIES.items() for metric in metrics
+    ]
+    vectors = np.empty((n, snapshot_vector_length()), dtype="<f8")
+    for index, column in enumerate(columns):
+        vectors[:, index] = column[:n]
+
+    metadata = zip(history.ids[:n], history.companies[:n], history.dates[:n].astype(str))
+    metadata_block = pack_snapshot_strings(value for record in metadata for value in record)
+    return b"".join([
+        SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, snapshot_vector_length(), n),
+        vectors.tobytes(),
+        SNAPSHOT_BLOCK_LENGTH.pack(len(metadata_block)),
+        metadata_block
+    ])
+
+def load_snapshot(data):
+    """Unpack a binary snapshot into the list of assessments kept in session history"""
+    magic, version, vector_length, count = SNAPSHOT_HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not an efficiency assessment snapshot")
+    if version not in SNAPSHOT_SCORE_TYPES or vector_length != snapshot_vector_length():
+        raise ValueError(f"Unsupported snapshot version {version}")
+
+    offset = SNAPSHOT_HEADER.size
+    vectors = array(SNAPSHOT_SCORE_TYPES[version])
+    vectors.frombytes(data[offset:offset + count * vector_length * vectors.itemsize])
+    if sys.byteorder == "big":
+        vectors.byteswap()
+    offset += count * vector_length * vectors.itemsize
+    (metadata_length,) = SNAPSHOT_BLOCK_LENGTH.unpack_from(data, offset)
+    offset += SNAPSHOT_BLOCK_LENGTH.size
+    metadata_block = data[offset:offset + metadata_length]
+    if version == 1:
+        records = metadata_block.decode("utf-8").split(SNAPSHOT_V1_RECORD_SEPARATOR) if count else []
+        metadata = [record.split(SNAPSHOT_V1_FIELD_SEPARATOR) for record in records]
+    else:
+        strings = unpack_snapshot_strings(metadata_block, count * 3)
+        metadata = zip(strings[0::3], strings[1::3], strings[2::3])
+
+    assessments = []
+    for index, (assessment_id, company_name, assessment_date) in enumerate(metadata):
+        values = iter(vectors[index * vector_length:(index + 1) * vector_length])
+        overall_efficiency = next(values)
+        category_scores = {category: next(values) for category in EFFICIENCY_CATEGORIES}
+        metric_scores = {
+            category: {metric: next(values) for metric in metrics}
+            for category, metrics in EFFICIENCY_CATEGORIES.items()
+        }
+        assessments.append({
+            "id": assessment_id,
+            "company_name": company_name,
+            "date": assessment_date,
+            "overall_efficiency": overall_efficiency,
+            "category_scores": category_scores,
+            "metric_scores": metric_scores
+        })
+    return assessments
+
+# Assessment History Store
+HISTORY_CHART_POINTS = 500
+HISTORY_TABLE_ROWS = 1000
+
+# Rollup granularities from finest to coarsest: (label, SQL bucket start for a date column, days per bucket).
+# Day, week and month rollups are materialized; years are summed from the month rollups.
+ROLLUP_GRANULARITIES = [
+    ("Day", "date", 1),
+    ("Week", "date(date, '-' || ((CAST(strftime('%w', date) AS INTEGER) + 6) % 7) || ' days')", 7),
+    ("Month", "strftime('%Y-%m-01', date)", 30)
+]
+YEAR_DAYS = 365
+
+def rollup_buckets(assessment_date):
+    """Start date of the day, week (Monday) and month buckets containing a date"""
+    day = datetime.strptime(assessment_date, "%Y-%m-%d").date()
+    return {
+        "Day": day.isoformat(),
+        "Week": (day - timedelta(days=day.weekday())).isoformat(),
+        "Month": day.replace(day=1).isoformat()
+    }
+
+class AssessmentStore:
+    """Durable assessment history in SQLite, indexed by company and date
+
+    Alongside the raw rows it maintains rollups: per company, bucket and score,
+    the count, sum, min and max, updated incrementally on every save.
+    """
+
+    CREATE_SQL = """
+        CREATE TABLE IF NOT EXISTS assessments (
+            id TEXT PRIMARY KEY,
+            company_name TEXT NOT NULL,
+            date TEXT NOT NULL,
+            overall_efficiency REAL NOT NULL,
+            category_scores TEXT NOT NULL,
+            metric_scores TEXT NOT NULL
+        )
+    """
+    CREATE_ROLLUPS_SQL = """
+        CREATE TABLE IF NOT EXISTS assessment_rollups (
+            granularity TEXT NOT NULL,
+            company_name TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            score TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            total REAL NOT NULL,
+            minimum REAL NOT NULL,
+            maximum REAL NOT NULL,
+            PRIMARY KEY (granularity, company_name, score, bucket)
+        )
+    """
+    INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_assessments_company_date ON assessments (company_name, date)"
+    INSERT_SQL = "INSERT OR REPLACE INTO assessments VALUES (?, ?, ?, ?, ?, ?)"
+    EXISTING_SQL = "SELECT company_name FROM assessments WHERE id = ?"
+    ROLLUP_UPSERT_SQL = """
+        INSERT INTO assessment_rollups VALUES (?, ?, ?, ?, 1, ?, ?, ?)
+        ON CONFLICT (granularity, company_name, score, bucket) DO UPDATE SET
+            count = count + 1,
+            total = total + excluded.total,
+            minimum = MIN(minimum, excluded.minimum),
+            maximum = MAX(maximum, excluded.maximum)
+    """
+    ROLLUP_REBUILD_SQL = """
+        INSERT INTO assessment_rollups
+        SELECT ?, company_name, {bucket}, ?, COUNT(*), SUM({value}), MIN({value}), MAX({value})
+        FROM assessments WHERE company_name = ? GROUP BY company_name, {bucket}
+    """
+    COMPANIES_SQL = "SELECT DISTINCT company_name FROM assessments ORDER BY company_name"
+    DATE_RANGE_SQL = "SELECT MIN(date), MAX(date) FROM assessments WHERE company_name = ?"
+    # One column per score, extracted from the JSON in SQLite, in HistoryColumns order
+    COLUMNS_SQL = """
+        SELECT id, company_name, date, overall_efficiency, {scores}
+        FROM assessments WHERE company_name = ? AND date BETWEEN ? AND ?
+        ORDER BY date
+    """
+    RANGE_SQL = """
+        SELECT id, company_name, date, overall_efficiency, category_scores, metric_scores
+        FROM assessments WHERE company_name = ? AND date BETWEEN ? AND ?
+        ORDER BY date DESC LIMIT ?
+    """
+    ROLLUP_SQL = """
+        SELECT bucket, total / count, minimum, maximum, count
+        FROM assessment_rollups
+        WHERE granularity = ? AND company_name = ? AND score = ? AND bucket BETWEEN ? AND ?
+        ORDER BY bucket
+    """
+    YEAR_ROLLUP_SQL = """
+        SELECT substr(bucket, 1, 4) || '-01-01', SUM(total) / SUM(count), MIN(minimum), MAX(maximum), SUM(count)
+        FROM assessment_rollups
+        WHERE granularity = 'Month' AND company_name = ? AND score = ? AND bucket BETWEEN ? AND ?
+        GROUP BY substr(bucket, 1, 4) ORDER BY 1
+    """
+
+    def __init__(self, db_path="assessments.db"):
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(self.CREATE_SQL)
+            self.connection.execute(self.CREATE_ROLLUPS_SQL)
+            self.connection.execute(self.INDEX_SQL)
+            # Databases created before rollups existed get them built once
+            has_rollups = self.connection.execute("SELECT 1 FROM assessment_rollups LIMIT 1").fetchone()
+            if not has_rollups:
+                for (company_name,) in self.connection.execute(self.COMPANIES_SQL).fetchall():
+                    self._rebuild_rollups(company_name)
+
+    @staticmethod
+    def _score_values(assessment):
+        return {"Overall Efficiency": assessment["overall_efficiency"], **assessment["category_scores"]}
+
+    def _rebuild_rollups(self, company_name):
+        """Recompute a company's rollups from raw rows, used when an assessment is overwritten"""
+        self.connection.execute("DELETE FROM assessment_rollups WHERE company_name = ?", (company_name,))
+        score_columns = {"Overall Efficiency": "overall_efficiency"}
+        score_columns.update({
+            category: f"json_extract(category_scores, '$.\"{category}\"')" for category in EFFICIENCY_CATEGORIES
+        })
+        for granularity, bucket, _ in ROLLUP_GRANULARITIES:
+            for score, value in score_columns.items():
+                self.connection.execute(
+                    self.ROLLUP_REBUILD_SQL.format(bucket=bucket, value=value),
+                    (granularity, score, company_name)
+                )
+
+    def save(self, assessments):
+        """Store assessments and fold them into the rollups"""
+        with self.lock, self.connection:
+            overwritten = set()
+            for a in assessments:
+                existing = self.connection.execute(self.EXISTING_SQL, (a["id"],)).fetchone()
+                if existing:
+                    overwritten.update([existing[0], a["company_name"]])
+                self.connection.execute(self.INSERT_SQL, (
+                    a["id"], a["company_name"], a["date"], a["overall_efficiency"],
+                    json.dumps(a["category_scores"]), json.dumps(a["metric_scores"])
+                ))
+                if a["company_name"] in overwritten:
+                    continue
+                buckets = rollup_buckets(a["date"])
+                self.connection.executemany(self.ROLLUP_UPSERT_SQL, [
+                    (granularity, a["company_name"], bucket, score, value, value, value)
+                    for granularity, bucket in buckets.items()
+                    for score, value in self._score_values(a).items()
+                ])
+            # Counts and sums cannot be corrected for a replaced row, so rebuild those companies
+            for company_name in overwritten:
+                self._rebuild_rollups(company_name)
+
+    def companies(self):
+        with self.lock:
+            return [row[0] for row in self.connection.execute(self.COMPANIES_SQL)]
+
+    def date_range(self, company_name):
+        with self.lock:
+            first, last = self.connection.execute(self.DATE_RANGE_SQL, (company_name,)).fetchone()
+        return datetime.strptime(first, "%Y-%m-%d").date(), datetime.strptime(last, "%Y-%m-%d").date()
+
+    def query(self, company_name, start, end, limit=HISTORY_TABLE_ROWS):
+        """Most recent assessments for a company within a date range"""
+        with self.lock:
+            rows = self.connection.execute(
+                self.RANGE_SQL, (company_name, start.isoformat(), end.isoformat(), limit)
+            ).fetchall()
+        return [
+            {
+                "id": assessment_id,
+                "company_name": company,
+                "date": assessment_date,
+                "overall_efficiency": overall,
+                "category_scores": json.loads(category_scores),
+                "metric_scores": json.loads(metric_scores)
+            }
+            for assessment_id, company, assessment_date, overall, category_scores, metric_scores in rows
+        ]
+
+    def columns(self, company_name, start, end):
+        """A company's assessments within a date range as HistoryColumns, oldest first"""
+        scores = [f"json_extract(category_scores, '$.\"{category}\"')" for category in EFFICIENCY_CATEGORIES]
+        scores += [
+            f"json_extract(metric_scores, '$.\"{category}\".\"{metric}\"')"
+            for category, metrics in EFFICIENCY_CATEGORIES.items() for metric in metrics
+        ]
+        with self.lock:
+            rows = self.connection.execute(
+                self.COLUMNS_SQL.format(scores=", ".join(scores)), (company_name, start.isoformat(), end.isoformat())
+            ).fetchall()
+        return HistoryColumns.from_rows(rows)
+
+    def trend(self, company_name, start, end, score="Overall Efficiency", max_points=HISTORY_CHART_POINTS):
+        """Pre-aggregated score per bucket, using the finest granularity that fits max_points"""
+        span_days = (end - start).days + 1
+        first_bucket = rollup_buckets(start.isoformat())
+        with self.lock:
+            for granularity, _, days in ROLLUP_GRANULARITIES:
+                if span_days / days <= max_points:
+                    rows = self.connection.execute(
+                        self.ROLLUP_SQL,
+                        (granularity, company_name, score, first_bucket[granularity], end.isoformat())
+                    ).fetchall()
+                    break
+            else:
+                granularity = "Year"
+                rows = self.connection.execute(
+                    self.YEAR_ROLLUP_SQL,
+                    (company_name, score, first_bucket["Month"][:4] + "-01-01", end.isoformat())
+                ).fetchall()
+        return granularity, pd.DataFrame(rows, columns=["Date", score, "Minimum", "Maximum", "Assessments"])
+
+@st.cache_resource
+def get_assessment_store():
+    return AssessmentStore(os.environ.get("ASSESSMENT_DB_PATH", "assessments.db"))
+
+class HistoryColumns:
+    """Assessment history as growable typed NumPy columns with a date index"""
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        self.ids = np.empty(capacity, dtype=object)
+        self.companies = np.empty(capacity, dtype=object)
+        self.dates = np.empty(capacity, dtype="datetime64[D]")
+        self.overall = np.empty(capacity, dtype=np.float64)
+        self.categories = {category: np.empty(capacity, dtype=np.float64) for category in EFFICIENCY_CATEGORIES}
+        self.metrics = {
+            (category, metric): np.empty(capacity, dtype=np.float64)
+            for category, metrics in EFFICIENCY_CATEGORIES.items() for metric in metrics
+        }
+        self.snapshot_data = None
+
+    @classmethod
+    def from_assessments(cls, assessments):
+        history = cls(capacity=max(64, len(assessments)))
+        for assessment in assessments:
+            history.append(assessment)
+        return history
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Fill the columns from (id, company, date, overall, category scores..., metric scores...) rows"""
+        n = len(rows)
+        history = cls(capacity=max(64, n))
+        if n:
+            values = list(zip(*rows))
+            history.ids[:n] = values[0]
+            history.companies[:n] = values[1]
+            history.dates[:n] = np.array(values[2], dtype="datetime64[D]")
+            # Scores missing from the JSON come back as NULL and load as NaN
+            scores = [history.overall, *history.categories.values(), *history.metrics.values()]
+            for column, column_values in zip(scores, values[3:]):
+                column[:n] = np.array(column_values, dtype=np.float64)
+        history.size = n
+        return history
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self):
+        # Doubling keeps appends amortized O(1)
+        capacity = len(self.overall) * 2
+        for name in ("ids", "companies", "dates", "overall"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+        for columns in (self.categories, self.metrics):
+            for key, column in columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self.size] = column[:self.size]
+                columns[key] = grown
+
+    def append(self, assessment):
+        if self.size == len(self.overall):
+            self._grow()
+        i = self.size
+        self.ids[i] = assessment["id"]
+        self.companies[i] = assessment["company_name"]
+        self.dates[i] = np.datetime64(assessment["date"], "D")
+        self.overall[i] = assessment["overall_efficiency"]
+        for category, column in self.categories.items():
+            column[i] = assessment["category_scores"][category]
+        for (category, metric), column in self.metrics.items():
+            column[i] = assessment["metric_scores"][category][metric]
+        self.size += 1
+        self.snapshot_data = None
+
+    def snapshot(self):
+        """Binary snapshot of the history, packed once and reused until the next append"""
+        if self.snapshot_data is None:
+            self.snapshot_data = save_snapshot(self)
+        return self.snapshot_data
+
+    def frame(self):
+        """DataFrame over the filled part of the columns; slices are views, not copies"""
+        n = self.size
+        data = {"Company": self.companies[:n], "Overall Efficiency": self.overall[:n]}
+        data.update({category: column[:n] for category, column in self.categories.items()})
+        return pd.DataFrame(data, index=pd.DatetimeIndex(self.dates[:n], name="Date"), copy=False)
+
+    def records(self):
+        """Rebuild assessment dicts"""
+        return [
+            {
+                "id": self.ids[i],
+                "company_name": self.companies[i],
+                "date": str(self.dates[i]),
+                "overall_efficiency": float(self.overall[i]),
+                "category_scores": {category: float(column[i]) for category, column in self.categories.items()},
+                "metric_scores": {
+                    category: {metric: float(self.metrics[(category, metric)][i]) for metric in metrics}
+                    for category, metrics in EFFICIENCY_CATEGORIES.items()
+                }
+            }
+            for i in range(self.size)
+        ]
+
+init_session_state()
+
+# Assessment Fragment
+def current_scores():
+    """Metric, category and overall scores read from the slider state"""
+    metric_scores = {
+        category: {metric: st.session_state.get(f"{category}_{metric}", 0) for metric in metrics}
+        for category, metrics in EFFICIENCY_CATEGORIES.items()
+    }
+    category_scores = {category: calculate_category_score(scores) for category, scores in metric_scores.items()}
+    return metric_scores, category_scores, calculate_overall_efficiency(category_scores)
+
+# A slider move reruns only this fragment, not the history queries or snapshot export
+@st.fragment
+def render_assessment():
+    metrics_tab, visualizations_tab = st.tabs(["Metrics", "Visualizations"])
+
+    with metrics_tab:
         category_scores = {}
         metric_scores = {}
         
@@ -194,52 +723,19 @@ def main():
             st.progress(category_scores[category]/100)
             st.markdown("---")
 
-        overall_efficiency = calculate_overall_efficiency(category_scores)
-
-    # Tab 2: Visualizations
-    with tab2:
+    with visualizations_tab:
+        fig_radar, fig_bar = build_charts(
+            tuple(category_scores.values()),
+            tuple((category, tuple(metrics.values())) for category, metrics in metric_scores.items())
+        )
         col1, col2 = st.columns(2)
         
         # Radar Chart
         with col1:
-            categories = list(category_scores.keys())
-            values = list(category_scores.values())
-            
-            fig_radar = go.Figure(data=go.Scatterpolar(
-                r=values,
-                theta=categories,
-                fill='toself',
-                name='Current Assessment'
-            ))
-            
-            fig_radar.update_layout(
-                polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-                showlegend=True,
-                title="Efficiency Radar Chart"
-            )
             st.plotly_chart(fig_radar, use_container_width=True)
 
         # Detailed Metrics Bar Chart
         with col2:
-            metrics_data = []
-            for category, metrics in metric_scores.items():
-                for metric, value in metrics.items():
-                    metrics_data.append({
-                        "Category": category,
-                        "Metric": metric,
-                        "Value": value
-                    })
-            
-            df_metrics = pd.DataFrame(metrics_data)
-            fig_bar = px.bar(
-                df_metrics,
-                x="Value",
-                y="Metric",
-                color="Category",
-                title="Detailed Metrics Breakdown",
-                orientation='h'
-            )
-            fig_bar.update_layout(yaxis={'categoryorder':'total ascending'})
             st.plotly_chart(fig_bar, use_container_width=True)
 
         # Recommendations
@@ -256,8 +752,37 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
 
-    # Tab 3: History
-    with tab3:
+# Main Application
+def main():
+    st.title("🎯 Business Efficiency Analytics Dashboard")
+    st.markdown("---")
+
+    # Sidebar
+    with st.sidebar:
+        st.header("Assessment Controls")
+        company_name = st.text_input("Company Name", "My Company")
+        assessment_date = st.date_input("Assessment Date", datetime.now())
+        st.markdown("---")
+        st.markdown("### Instructions")
+        st.markdown("""
+        1. Rate each metric from 0-25
+        2. Review the visualizations
+        3. Export your results
+        4. Track progress over time
+        """)
+
+    # Main Content
+    tab1, tab2 = st.tabs(["Assessment", "History"])
+
+    # Tab 1: Assessment (sliders and charts rerun on their own)
+    with tab1:
+        render_assessment()
+    metric_scores, category_scores, overall_efficiency = current_scores()
+    recommendations = generate_recommendations(category_scores)
+
+    # Tab 2: History
+    with tab2:
+        store = get_assessment_store()
         if st.button("Save Current Assessment"):
             assessment_data = {
                 "id": st.session_state.current_assessment_id,
@@ -267,23 +792,51 @@ def main():
                 "category_scores": category_scores,
                 "metric_scores": metric_scores
             }
-            st.session_state.history.append(assessment_data)
+            store.save([assessment_data])
+            if st.session_state.history_key is not None:
+                loaded_company, loaded_start, loaded_end = st.session_state.history_key
+                if loaded_company == company_name and loaded_start <= assessment_date <= loaded_end:
+                    st.session_state.history.append(assessment_data)
             st.session_state.current_assessment_id = str(uuid.uuid4())
             st.success("Assessment saved!")
 
-        if st.session_state.history:
-            history_df = pd.DataFrame([
-                {
-                    "Date": h["date"],
-                    "Company": h["company_name"],
-                    "Overall Efficiency": h["overall_efficiency"],
-                    **h["category_scores"]
-                }
-                for h in st.session_state.history
-            ])
-            
-            st.line_chart(history_df.set_index("Date")["Overall Efficiency"])
-            st.dataframe(history_df)
+        companies = store.companies()
+        if companies:
+            history_company = st.selectbox(
+                "Company",
+                companies,
+                index=companies.index(company_name) if company_name in companies else 0
+            )
+            first_date, last_date = store.date_range(history_company)
+            date_range = st.date_input(
+                "Date Range",
+                value=(first_date, last_date),
+                min_value=first_date,
+                max_value=last_date
+            )
+            if len(date_range) == 2:
+                start_date, end_date = date_range
+                # Load only the selected range into the columnar buffer, once per selection; saves append to it
+                history_key = (history_company, start_date, end_date)
+                if st.session_state.history_key != history_key:
+                    st.session_state.history = store.columns(*history_key)
+                    st.session_state.history_key = history_key
+                history_df = st.session_state.history.frame()
+
+                trend_score = st.selectbox("Trend", ["Overall Efficiency", *EFFICIENCY_CATEGORIES])
+                chart_mode = "Period averages"
+                if len(history_df) > HISTORY_CHART_POINTS:
+                    chart_mode = st.radio("Chart", ["Period averages", "Downsampled points"], horizontal=True)
+                if chart_mode == "Downsampled points":
+                    chart_key = (*st.session_state.history_key, trend_score)
+                    st.plotly_chart(build_history_figure(history_df[trend_score], chart_key), use_container_width=True)
+                elif len(history_df) > HISTORY_CHART_POINTS:
+                    bucket_label, trend_df = store.trend(history_company, start_date, end_date, score=trend_score)
+                    st.caption(f"{trend_score} averaged per {bucket_label.lower()}")
+                    st.line_chart(trend_df.set_index("Date")[[trend_score, "Minimum", "Maximum"]])
+                else:
+                    st.line_chart(history_df[trend_score])
+                st.dataframe(history_df.tail(HISTORY_TABLE_ROWS))
 
     # Export Options
     st.sidebar.markdown("---")
@@ -305,5 +858,36 @@ def main():
             data=json.dumps(export_data, indent=2)
         )
 
+    # Session Snapshot
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### Session Snapshot")
+    # Packing a long history takes a while, so it happens on request rather than on every rerun
+    history = st.session_state.history
+    # The snapshot holds the history loaded above: one company's saved assessments in the selected range
+    if st.session_state.history_key is not None:
+        loaded_company, loaded_start, loaded_end = st.session_state.history_key
+        st.sidebar.caption(f"Covers the {len(history):,} saved assessments of {loaded_company} from {loaded_start} to {loaded_end}")
+    if st.sidebar.button("Prepare Snapshot"):
+        history.snapshot()
+    if history.snapshot_data is not None:
+        st.sidebar.download_button(
+            label="💾 Download Snapshot",
+            file_name=f"efficiency_history_{datetime.now().strftime('%Y%m%d')}.doge",
+            mime="application/octet-stream",
+            data=history.snapshot_data
+        )
+    snapshot_file = st.sidebar.file_uploader("Restore Snapshot", type=["doge"])
+    if snapshot_file is not None and st.sidebar.button("Restore History"):
+        try:
+            restored = load_snapshot(snapshot_file.getvalue())
+            get_assessment_store().save(restored)
+            # Reload the history buffer from the store on the next rerun; restored
+            # assessments may replace saved ones without changing a chart's key
+            st.session_state.history_key = None
+            cached_lttb_indices.clear()
+            st.sidebar.success(f"Restored {len(restored)} assessments")
+        except (ValueError, struct.error) as e:
+            st.sidebar.error(f"Error restoring snapshot: {e}")
+
 if __name__ == "__main__":
     main()
@@ -1,14 +1,22 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import ast
 import json
-import xml.etree.ElementTree as ET
-import requests
-from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+import gzip
+import lzma
+from io import BytesIO, StringIO
 from base64 import b64decode
+from types import MappingProxyType
+from app_common import LazyModule, regulations_editor, regulations_import, set_regulations
+from scoring import calculate_efficiency_score, calculate_effectiveness_score
+
+# Lazy Imports
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
+ET = LazyModule("xml.etree.ElementTree")
+requests = LazyModule("requests")
+pagesizes = LazyModule("reportlab.lib.pagesizes")
+canvas = LazyModule("reportlab.pdfgen.canvas")
 
 # Set page config
 st.set_page_config(
@@ -17,6 +25,38 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Define efficiency categories for government departments
+@st.cache_resource
+def get_efficiency_category_template():
+    """Category and metric names, built once per process and shared read-only by every session"""
+    categories = {
+        "Operational Efficiency": {
+            "Process Optimization": 0,
+            "Resource Utilization": 0,
+            "Service Delivery Speed": 0,
+            "Digital Transformation": 0
+        },
+        "Fiscal Efficiency": {
+            "Budget Management": 0,
+            "Cost Control": 0,
+            "Resource Allocation": 0,
+            "Financial Transparency": 0
+        },
+        "Administrative Efficiency": {
+            "Paperwork Processing": 0,
+            "Response Time": 0,
+            "Staff Productivity": 0,
+            "Regulatory Compliance": 0
+        },
+        "Public Service Efficiency": {
+            "Citizen Satisfaction": 0,
+            "Service Accessibility": 0,
+            "Communication Effectiveness": 0,
+            "Public Engagement": 0
+        }
+    }
+    return MappingProxyType({category: tuple(metrics) for category, metrics in categories.items()})
+
 # GitHub Data Loading Functions
 def fetch_github_raw_file(file_path):
     """Fetch raw file content from GitHub repository"""
@@ -26,6 +66,131 @@ def fetch_github_raw_file(file_path):
         return response.text
     return None
 
+# Export Loading Functions
+# Columns every department export must provide, with the type they are validated against
+EXPORT_SCHEMA = {
+    "Department Name": "text",
+    "Employees": "numeric",
+    "Regulations": "text",
+    "Budget (Million USD)": "numeric",
+    "Budget Utilization (%)": "numeric",
+    "Regulatory Oversight (%)": "numeric",
+    "Economic Oversight (%)": "numeric",
+    "Effectiveness Score": "numeric"
+}
+NESTED_EXPORT_COLUMNS = ["Category Scores", "Detailed Metrics"]
+# Free-text columns that exports may carry besides the required schema
+OPTIONAL_TEXT_COLUMNS = ["Description", "Current Governance", "Suggested Governance"]
+
+def parse_nested_value(value):
+    """Parse a nested score dict written into a single CSV cell by older exports"""
+    if isinstance(value, str):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return None
+    return value
+
+def xml_field_value(field):
+    """Read a <Field> element, recursing into nested fields"""
+    if len(field):
+        return {child.get("name", child.tag): xml_field_value(child) for child in field}
+    return field.text
+
+def export_score_columns():
+    """Flattened score column names from the category definitions: "<Category>.Total" and "<Category>.<Metric>" """
+    template = get_efficiency_category_template()
+    totals = {f"{category}.Total": category for category in template}
+    metrics = {f"{category}.{metric}": (category, metric) for category, names in template.items() for metric in names}
+    return totals, metrics
+
+def normalize_nested_records(data):
+    """Expand nested "Category Scores"/"Detailed Metrics" dicts into the flat score columns"""
+    records = pd.json_normalize(data, sep=".")
+    totals, metrics = export_score_columns()
+    renames = {f"Category Scores.{category}": column for column, category in totals.items()}
+    renames.update({f"Detailed Metrics.{category}.{metric}": column for column, (category, metric) in metrics.items()})
+    records = records.rename(columns=renames)
+    # Cells that could not be parsed stay behind as an unexpanded nested column
+    return records.drop(columns=[column for column in NESTED_EXPORT_COLUMNS if column in records.columns])
+
+def parse_export_records(content, file_format):
+    """Parse a CSV, JSON or XML department export into a DataFrame with one row per department and flat score columns"""
+    if file_format == "CSV":
+        records = pd.read_csv(StringIO(content))
+        nested = [column for column in NESTED_EXPORT_COLUMNS if column in records.columns]
+        if not nested:
+            return records
+        # Older CSV exports wrote each nested dict into a single cell
+        for column in nested:
+            records[column] = records[column].map(parse_nested_value)
+        return normalize_nested_records(records.to_dict("records"))
+    if file_format == "JSON":
+        data = json.loads(content)
+        return normalize_nested_records(data if isinstance(data, list) else [data])
+    if file_format == "XML":
+        root = ET.fromstring(content)
+        departments = root.findall("Department")
+        if departments:
+            return normalize_nested_records([xml_field_value(department) for department in departments])
+        # Older exports wrote one department as plain child elements of the root
+        return pd.DataFrame([{child.tag: child.text for child in root}])
+    raise ValueError(f"Unsupported export format: {file_format}")
+
+def validate_export_records(records):
+    """Check the export schema and coerce types; returns valid rows and the number of rejected rows"""
+    missing = [column for column in EXPORT_SCHEMA if column not in records.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    numeric_columns = [column for column, kind in EXPORT_SCHEMA.items() if kind == "numeric"]
+    records = records.copy()
+    records[numeric_columns] = records[numeric_columns].apply(pd.to_numeric, errors="coerce")
+    # Empty text cells come back as NaN from CSV and None from XML; both restore as ""
+    text_columns = [column for column, kind in EXPORT_SCHEMA.items() if kind == "text"]
+    text_columns += [column for column in OPTIONAL_TEXT_COLUMNS if column in records.columns]
+    records[text_columns] = records[text_columns].fillna("").astype(str)
+    # XML exports carry the scores as text; unreadable scores become NaN and are skipped on restore
+    totals, metrics = export_score_columns()
+    score_columns = [column for column in records.columns if column in totals or column in metrics]
+    records[score_columns] = records[score_columns].apply(pd.to_numeric, errors="coerce")
+    valid = records[numeric_columns].notna().all(axis=1) & (records["Department Name"] != "")
+    return records[valid].reset_index(drop=True), int((~valid).sum())
+
+def score_export_records(records):
+    """Recompute the efficiency score for every loaded department at once"""
+    regulations = records["Regulations"].str.strip()
+    num_regulations = (regulations.str.count(",") + 1).where(regulations != "", 0)
+    score = (
+        (records["Budget Utilization (%)"] * 0.3) +
+        ((100 - records["Regulatory Oversight (%)"]) * 0.2) +
+        ((2000 / records["Employees"]).clip(upper=100) * 0.2) +
+        ((100 - num_regulations * 2).clip(lower=0) * 0.15) +
+        (100 - records["Economic Oversight (%)"] * 0.15) +
+        (records["Effectiveness Score"] * 0.5)
+    )
+    records["Efficiency Score"] = (score / 1.5).clip(upper=100)
+    return records
+
+# Decompressors for compressed exports, by file extension
+EXPORT_DECOMPRESSION = {"gz": gzip.decompress, "xz": lzma.decompress}
+
+def export_file_format(file_name):
+    """Export format and compression from a file name: "department_efficiency.csv.gz" -> ("CSV", "gz")"""
+    parts = file_name.lower().rsplit(".", 2)
+    if parts[-1] in EXPORT_DECOMPRESSION and len(parts) == 3:
+        return parts[-2].upper(), parts[-1]
+    return parts[-1].upper(), None
+
+def load_export_records(content, file_format, compression=None):
+    """Parse, validate and score a department export in one pass; .gz and .xz bytes are decompressed first"""
+    if compression:
+        content = EXPORT_DECOMPRESSION[compression](content)
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    records, rejected = validate_export_records(parse_export_records(content, file_format))
+    return score_export_records(records), rejected
+
 def add_github_data_section():
     st.sidebar.header("Load Saved Department Data")
     
@@ -40,48 +205,73 @@ def add_github_data_section():
         "Select file format to load",
         options=list(file_options.keys())
     )
+    uploaded_file = st.sidebar.file_uploader("Or upload a saved export", type=["csv", "json", "xml", "gz", "xz"])
     
-    if st.sidebar.button("Load Data"):
+    file_content = None
+    file_format = selected_format.split()[0]
+    compression = None
+    if uploaded_file is not None and st.sidebar.button("Load Uploaded File"):
+        file_content = uploaded_file.getvalue()
+        file_format, compression = export_file_format(uploaded_file.name)
+    elif st.sidebar.button("Load Data"):
         file_name = file_options[selected_format]
         file_content = fetch_github_raw_file(file_name)
-        
-        if file_content:
-            try:
-                if selected_format == "CSV Format":
-                    df = pd.read_csv(BytesIO(file_content.encode()))
-                    st.sidebar.success("CSV data loaded successfully")
-                    return df.to_dict('records')[0] if not df.empty else None
-                
-                elif selected_format == "JSON Format":
-                    data = json.loads(file_content)
-                    st.sidebar.success("JSON data loaded successfully")
-                    return data
-                
-                elif selected_format == "XML Format":
-                    root = ET.fromstring(file_content)
-                    data = {child.tag: child.text for child in root}
-                    st.sidebar.success("XML data loaded successfully")
-                    return data
-                
-                elif selected_format == "PDF Format":
-                    st.sidebar.warning("PDF preview not available. Click below to download.")
-                    st.sidebar.download_button(
-                        "Download PDF",
-                        file_content.encode(),
-                        file_name=file_options[selected_format],
-                        mime="application/pdf"
-                    )
-                    return None
-                
-            except Exception as e:
-                st.sidebar.error(f"Error loading file: {str(e)}")
-        else:
+        if not file_content:
             st.sidebar.error("Failed to load file from repository")
+            return None
+        if selected_format == "PDF Format":
+            st.sidebar.warning("PDF preview not available. Click below to download.")
+            st.sidebar.download_button(
+                "Download PDF",
+                file_content.encode(),
+                file_name=file_name,
+                mime="application/pdf"
+            )
+            return None
+    
+    if file_content:
+        try:
+            records, rejected = load_export_records(file_content, file_format, compression)
+            st.sidebar.success(f"{file_format} data loaded successfully: {len(records)} department(s)")
+            if rejected:
+                st.sidebar.warning(f"{rejected} record(s) failed schema validation and were skipped")
+            return records
+        except Exception as e:
+            st.sidebar.error(f"Error loading file: {str(e)}")
     
     return None
 
+def restore_department_section():
+    """Pick one loaded department and restore it into the assessment widgets"""
+    records = st.session_state.get('loaded_records')
+    if records is None or records.empty:
+        return
+    
+    st.sidebar.subheader("Loaded Departments")
+    st.sidebar.dataframe(records[["Department Name", "Efficiency Score"]], hide_index=True)
+    index = st.sidebar.selectbox(
+        "Department to restore",
+        options=records.index,
+        format_func=lambda i: records.at[i, "Department Name"]
+    )
+    
+    if st.sidebar.button("Restore Department"):
+        record = records.loc[index].to_dict()
+        _, metrics = export_score_columns()
+        for column, (category, metric) in metrics.items():
+            value = record.get(column)
+            if value is not None and pd.notna(value):
+                st.session_state[f"{category}_{metric}"] = int(value)
+        st.session_state.restored_record = record
+        regulations = record.get("Regulations")
+        set_regulations([r.strip() for r in regulations.split(",") if r.strip()] if isinstance(regulations, str) else [])
+
 # Load GitHub data
-loaded_data = add_github_data_section()
+loaded_records = add_github_data_section()
+if loaded_records is not None:
+    st.session_state.loaded_records = loaded_records
+restore_department_section()
+restored_record = st.session_state.get('restored_record', {})
 
 # Title and description
 st.title("Government Department Efficiency Calculator")
@@ -94,72 +284,48 @@ Rate each component based on current department performance and governance metri
 if 'total_weight' not in st.session_state:
     st.session_state.total_weight = 0
 
-# Define efficiency categories for government departments
+# Per-run scores, filled in by the sliders below
 efficiency_categories = {
-    "Operational Efficiency": {
-        "Process Optimization": 0,
-        "Resource Utilization": 0,
-        "Service Delivery Speed": 0,
-        "Digital Transformation": 0
-    },
-    "Fiscal Efficiency": {
-        "Budget Management": 0,
-        "Cost Control": 0,
-        "Resource Allocation": 0,
-        "Financial Transparency": 0
-    },
-    "Administrative Efficiency": {
-        "Paperwork Processing": 0,
-        "Response Time": 0,
-        "Staff Productivity": 0,
-        "Regulatory Compliance": 0
-    },
-    "Public Service Efficiency": {
-        "Citizen Satisfaction": 0,
-        "Service Accessibility": 0,
-        "Communication Effectiveness": 0,
-        "Public Engagement": 0
-    }
+    category: dict.fromkeys(metrics, 0)
+    for category, metrics in get_efficiency_category_template().items()
 }
 
-# Update session state with loaded data if available
-if loaded_data:
-    for key, value in loaded_data.items():
-        if key in st.session_state:
-            st.session_state[key] = value
-
-# Utility Functions
-def calculate_efficiency_score(employees, budget, utilization, oversight, num_regulations, economic_oversight, effectiveness_score):
-    score = (
-        (utilization * 0.3) +
-        ((100 - oversight) * 0.2) +
-        (min(2000 / employees, 100) * 0.2) +
-        (max(100 - num_regulations * 2, 0) * 0.15) +
-        (100 - economic_oversight * 0.15) +
-        (effectiveness_score * 0.5)
-    )
-    return min(score / 1.5, 100)
-
-def calculate_effectiveness_score(communication, transparency, responsiveness, policy_impact, citizen_satisfaction):
-    return (communication + transparency + responsiveness + policy_impact + citizen_satisfaction) / 5 * 20
-
 # Export Functions
+def flatten_export_data(data):
+    """Expand the nested score dicts into typed columns such as 'Operational Efficiency.Process Optimization'"""
+    flat = {key: value for key, value in data.items() if key not in NESTED_EXPORT_COLUMNS}
+    for category, total in data.get("Category Scores", {}).items():
+        flat[f"{category}.Total"] = total
+    for category, metrics in data.get("Detailed Metrics", {}).items():
+        for metric, value in metrics.items():
+            flat[f"{category}.{metric}"] = value
+    return flat
+
 def convert_to_csv(data):
     return data.to_csv(index=False).encode('utf-8')
 
-def convert_to_json(data):
+def convert_to_json(data, compact=False):
+    if compact:
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
     return json.dumps(data, indent=4).encode('utf-8')
 
+def add_xml_fields(parent, data):
+    for key, value in data.items():
+        field = ET.SubElement(parent, "Field", name=str(key))
+        if isinstance(value, dict):
+            add_xml_fields(field, value)
+        else:
+            field.text = str(value)
+
 def convert_to_xml(data):
     root = ET.Element("DepartmentData")
-    for key, value in data.items():
-        child = ET.SubElement(root, key)
-        child.text = str(value)
+    for record in (data if isinstance(data, list) else [data]):
+        add_xml_fields(ET.SubElement(root, "Department"), record)
     return ET.tostring(root, encoding='utf-8')
 
 def convert_to_pdf(data):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
+    p = canvas.Canvas(buffer, pagesize=pagesizes.letter)
     p.setFont("Helvetica", 12)
     y_position = 750
     for key, value in data.items():
@@ -170,10 +336,90 @@ def convert_to_pdf(data):
     buffer.seek(0)
     return buffer
 
+def convert_to_parquet(data):
+    """Parquet bytes, or None when no Parquet engine (pyarrow) is installed"""
+    buffer = BytesIO()
+    try:
+        data.to_parquet(buffer, index=False)
+    except ImportError:
+        return None
+    return buffer.getvalue()
+
+# Compression applied on top of the text exports (extension, mime type, compressor)
+EXPORT_COMPRESSION = {
+    "None": ("", None, None),
+    "gzip": (".gz", "application/gzip", gzip.compress),
+    "xz": (".xz", "application/x-xz", lzma.compress)
+}
+
+def compress_export(data, compression):
+    """Compress exported bytes with the selected method"""
+    _, _, compressor = EXPORT_COMPRESSION[compression]
+    if compressor is None:
+        return data
+    return compressor(data)
+
+# Chart Functions
+CHART_CACHE_ENTRIES = 256
+
+@st.cache_resource
+def get_chart_templates():
+    """Radar and bar figures with zero scores, built once; px.bar only runs here"""
+    template = get_efficiency_category_template()
+    categories = list(template)
+    radar = go.Figure(data=go.Scatterpolar(
+        r=[0] * len(categories),
+        theta=categories,
+        fill='toself'
+    ))
+    radar.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        showlegend=False,
+        title="Efficiency Radar Chart"
+    )
+
+    df_metrics = pd.DataFrame([
+        {"Category": category, "Metric": metric, "Value": 0}
+        for category, metrics in template.items()
+        for metric in metrics
+    ])
+    bar = px.bar(
+        df_metrics,
+        x="Value",
+        y="Metric",
+        color="Category",
+        title="Detailed Metrics Breakdown",
+        orientation='h'
+    )
+    bar.update_layout(yaxis={'categoryorder':'total ascending'})
+    return radar, bar
+
+@st.cache_resource(max_entries=CHART_CACHE_ENTRIES)
+def build_charts(category_values, metric_values):
+    """Copy the templates and fill in trace data; figures are shared by every rerun with the same scores"""
+    radar_template, bar_template = get_chart_templates()
+    radar = go.Figure(radar_template)
+    radar.data[0].r = category_values
+    bar = go.Figure(bar_template)
+    # px.bar draws one trace per category, named after it
+    values_by_category = dict(metric_values)
+    for trace in bar.data:
+        trace.x = values_by_category[trace.name]
+    return radar, bar
+
 # Main Assessment Interface
-tab1, tab2 = st.tabs(["Metric Assessment", "Detailed Department Data"])
+def current_metric_scores():
+    """Slider scores and category totals read from session state, usable from either tab's fragment"""
+    scores = {
+        category: {metric: st.session_state.get(f"{category}_{metric}", 0) for metric in metrics}
+        for category, metrics in get_efficiency_category_template().items()
+    }
+    return scores, {category: sum(metrics.values()) for category, metrics in scores.items()}
 
-with tab1:
+# Each tab is a fragment, so a widget change reruns only its own tab
+@st.fragment
+def render_metric_assessment():
+    """Slider grid with the totals and charts that depend on it"""
     # Create columns for different categories
     st.header("Efficiency Metrics")
     cols = st.columns(len(efficiency_categories))
@@ -192,7 +438,6 @@ with tab1:
                     f"{metric}",
                     min_value=0,
                     max_value=25,
-                    value=0,
                     help=f"Rate {metric} from 0-25",
                     key=f"{category}_{metric}"
                 )
@@ -209,87 +454,70 @@ with tab1:
 
     # Create visualizations
     st.header("Efficiency Visualizations")
+    radar, bar = build_charts(
+        tuple(category_totals.values()),
+        tuple((category, tuple(metrics.values())) for category, metrics in efficiency_categories.items())
+    )
     col1, col2 = st.columns(2)
 
     # Radar Chart
     with col1:
-        categories = list(category_totals.keys())
-        values = list(category_totals.values())
-        
-        fig = go.Figure(data=go.Scatterpolar(
-            r=values,
-            theta=categories,
-            fill='toself'
-        ))
-        
-        fig.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-            showlegend=False,
-            title="Efficiency Radar Chart"
-        )
-        st.plotly_chart(fig)
+        st.plotly_chart(radar)
 
     # Bar Chart
     with col2:
-        metrics_data = []
-        for category, metrics in efficiency_categories.items():
-            for metric, value in metrics.items():
-                metrics_data.append({
-                    "Category": category,
-                    "Metric": metric,
-                    "Value": value
-                })
-        
-        df_metrics = pd.DataFrame(metrics_data)
-        fig = px.bar(
-            df_metrics,
-            x="Value",
-            y="Metric",
-            color="Category",
-            title="Detailed Metrics Breakdown",
-            orientation='h'
-        )
-        fig.update_layout(yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig)
+        st.plotly_chart(bar)
 
-with tab2:
+@st.fragment
+def render_department_details():
+    """Detailed department inputs and exports"""
     st.header("Enter Detailed Department Data")
     
-    # Basic Information
-    department_name = st.text_input("Department Name", value="Department of Public Works")
-    department_desc = st.text_area("Description of the Department", value="Handles infrastructure and public works projects.")
-    employees = st.number_input("Number of Employees", min_value=1, value=500)
+    batch_entry = st.checkbox("Batch entry", help="Collect the inputs below in one form and score them once on submit")
+    # Widgets inside a form do not rerun the app until the form is submitted
+    inputs = st.form("department_details") if batch_entry else st.container()
+    with inputs:
+        # Basic Information
+        department_name = st.text_input("Department Name", value=restored_record.get("Department Name", "Department of Public Works"))
+        department_desc = st.text_area("Description of the Department", value=restored_record.get("Description", "Handles infrastructure and public works projects."))
+        employees = st.number_input("Number of Employees", min_value=1, value=int(restored_record.get("Employees", 500)))
     
-    # Governance Information
-    current_governance = st.text_area("Current Areas of Governance", value="Road maintenance, public parks, waste management.")
-    suggested_governance = st.text_area("Suggested Areas of Governance", value="Renewable energy infrastructure, smart city development.")
+        # Governance Information
+        current_governance = st.text_area("Current Areas of Governance", value=restored_record.get("Current Governance", "Road maintenance, public parks, waste management."))
+        suggested_governance = st.text_area("Suggested Areas of Governance", value=restored_record.get("Suggested Governance", "Renewable energy infrastructure, smart city development."))
     
-    # Governing Regulations
-    st.subheader("Governing Regulations")
-    num_regulations = st.number_input("Number of regulations", min_value=0, value=3)
-    regulations = []
-    for i in range(num_regulations):
-        regulations.append(st.text_input(f"Regulation {i + 1}", value=f"Regulation {i + 1}"))
+        # Governing Regulations
+        st.subheader("Governing Regulations")
+        regulations = regulations_editor(["Regulation 1", "Regulation 2", "Regulation 3"])
+        num_regulations = len(regulations)
+        st.caption(f"{num_regulations} regulations")
+        if not batch_entry:
+            regulations_import()
     
-    # Budget and Oversight
-    col1, col2 = st.columns(2)
-    with col1:
-        budget = st.number_input("Annual Budget (in Million USD)", min_value=0.0, value=100.0)
-        utilization = st.slider("Budget Utilization (%)", 0, 100, 75)
-    with col2:
-        oversight = st.slider("Regulatory Oversight Level", 0, 100, 50)
-        economic_oversight = st.slider("Economic Oversight Level", 0, 100, 50)
+        # Budget and Oversight
+        col1, col2 = st.columns(2)
+        with col1:
+            budget = st.number_input("Annual Budget (in Million USD)", min_value=0.0, value=float(restored_record.get("Budget (Million USD)", 100.0)))
+            utilization = st.slider("Budget Utilization (%)", 0, 100, int(restored_record.get("Budget Utilization (%)", 75)))
+        with col2:
+            oversight = st.slider("Regulatory Oversight Level", 0, 100, int(restored_record.get("Regulatory Oversight (%)", 50)))
+            economic_oversight = st.slider("Economic Oversight Level", 0, 100, int(restored_record.get("Economic Oversight (%)", 50)))
     
-    # Qualitative Assessment
-    st.subheader("Qualitative Assessment")
-    qual_metrics = ["Communication", "Transparency", "Responsiveness", "Policy Impact", "Citizen Satisfaction"]
-    qual_scores = {}
-    for metric in qual_metrics:
-        qual_scores[metric] = st.select_slider(
-            metric,
-            options=[1, 2, 3, 4, 5],
-            format_func=lambda x: ["Very Poor", "Poor", "Average", "Good", "Excellent"][x-1]
-        )
+        # Qualitative Assessment
+        st.subheader("Qualitative Assessment")
+        qual_metrics = ["Communication", "Transparency", "Responsiveness", "Policy Impact", "Citizen Satisfaction"]
+        qual_scores = {}
+        for metric in qual_metrics:
+            qual_scores[metric] = st.select_slider(
+                metric,
+                options=[1, 2, 3, 4, 5],
+                format_func=lambda x: ["Very Poor", "Poor", "Average", "Good", "Excellent"][x-1]
+            )
+        if batch_entry:
+            st.form_submit_button("Apply Inputs")
+    # Buttons are not allowed inside a form, so batch entry offers the import below it
+    if batch_entry:
+        regulations_import()
 
     effectiveness_score = calculate_effectiveness_score(
         qual_scores["Communication"],
@@ -305,6 +533,7 @@ with tab2:
     )
 
     # Prepare export data
+    metric_scores, category_totals = current_metric_scores()
     export_data = {
         "Department Name": department_name,
         "Description": department_desc,
@@ -319,35 +548,57 @@ with tab2:
         "Effectiveness Score": effectiveness_score,
         "Efficiency Score": efficiency_score,
         "Category Scores": category_totals,
-        "Detailed Metrics": efficiency_categories
+        "Detailed Metrics": metric_scores
     }
 
     # Export options
     st.header("Export Options")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.download_button(
-            "Download as CSV",
-            data=convert_to_csv(pd.DataFrame([export_data])),
-            file_name="department_efficiency.csv",
-            mime="text/csv"
-        )
-        st.download_button(
-            "Download as JSON",
-            data=convert_to_json(export_data),
-            file_name="department_efficiency.json",
-            mime="application/json"
-        )
-    with col2:
-        st.download_button(
-            "Download as XML",
-            data=convert_to_xml(export_data),
-            file_name="department_efficiency.xml",
-            mime="application/xml"
-        )
-        st.download_button(
-            "Download as PDF",
-            data=convert_to_pdf(export_data),
-            file_name="department_efficiency.pdf",
-            mime="application/pdf"
-        )
+    compression = st.selectbox("Compression", options=list(EXPORT_COMPRESSION.keys()))
+    compact_json = st.checkbox("Compact JSON (no indentation)", value=False)
+    # Built on request from the current sliders, which rerun in their own fragment
+    if st.button("Prepare Exports"):
+        st.caption(f"Prepared from an overall efficiency of {sum(category_totals.values()) / 4:.1f}%")
+        suffix, compressed_mime, _ = EXPORT_COMPRESSION[compression]
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "Download as CSV",
+                data=compress_export(convert_to_csv(pd.DataFrame([flatten_export_data(export_data)])), compression),
+                file_name=f"department_efficiency.csv{suffix}",
+                mime=compressed_mime or "text/csv"
+            )
+            st.download_button(
+                "Download as JSON",
+                data=compress_export(convert_to_json(export_data, compact=compact_json), compression),
+                file_name=f"department_efficiency.json{suffix}",
+                mime=compressed_mime or "application/json"
+            )
+            parquet_data = convert_to_parquet(pd.DataFrame([flatten_export_data(export_data)]))
+            if parquet_data is None:
+                st.caption("Parquet export requires pyarrow (pip install pyarrow)")
+            else:
+                st.download_button(
+                    "Download as Parquet",
+                    data=parquet_data,
+                    file_name="department_efficiency.parquet",
+                    mime="application/vnd.apache.parquet"
+                )
+        with col2:
+            st.download_button(
+                "Download as XML",
+                data=compress_export(convert_to_xml(export_data), compression),
+                file_name=f"department_efficiency.xml{suffix}",
+                mime=compressed_mime or "application/xml"
+            )
+            st.download_button(
+                "Download as PDF",
+                data=convert_to_pdf(export_data),
+                file_name="department_efficiency.pdf",
+                mime="application/pdf"
+            )
+
+tab1, tab2 = st.tabs(["Metric Assessment", "Detailed Department Data"])
+with tab1:
+    render_metric_assessment()
+with tab2:
+    render_department_details()
@@ -1,14 +1,17 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import json
-import xml.etree.ElementTree as ET
-import requests
 from io import BytesIO, StringIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 import logging
+from app_common import LazyModule, parse_uploaded_file, regulations_editor, regulations_import
+
+# Lazy Imports
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
+ET = LazyModule("xml.etree.ElementTree")
+requests = LazyModule("requests")
+pagesizes = LazyModule("reportlab.lib.pagesizes")
+canvas = LazyModule("reportlab.pdfgen.canvas")
 
 # Configure logging
 logging.basicConfig(level=logging.ERROR, format="%(asctime)s - %(message)s")
@@ -40,51 +43,6 @@ def load_github_data(url):
         st.error(f"Failed to load GitHub data. Using default dataset.")
         return DEFAULT_DATA
 
-# Parse uploaded files
-def parse_uploaded_file(file):
-    """Parse uploaded file and return a DataFrame."""
-    if file is None:
-        return None
-    try:
-        file_extension = file.name.split('.')[-1].lower()
-        if file_extension == "csv":
-            df = pd.read_csv(file)
-            st.sidebar.success("CSV file loaded successfully")
-            return df
-        elif file_extension == "json":
-            data = json.load(file)
-            st.sidebar.success("JSON file loaded successfully")
-            return pd.DataFrame(data)
-        elif file_extension == "xml":
-            tree = ET.parse(file)
-            root = tree.getroot()
-            data = [{child.tag: child.text for child in element} for element in root]
-            st.sidebar.success("XML file loaded successfully")
-            return pd.DataFrame(data)
-        else:
-            st.sidebar.error("Unsupported file format")
-            return None
-    except Exception as e:
-        st.sidebar.error(f"Failed to load file: {e}")
-        return None
-
-# Utility functions for calculations
-def calculate_efficiency_score(employees, budget, utilization, oversight, num_regulations, economic_oversight, effectiveness_score):
-    """Calculate department efficiency score."""
-    score = (
-        (utilization * 0.3) +
-        ((100 - oversight) * 0.2) +
-        (min(2000 / employees, 100) * 0.2) +
-        (max(100 - num_regulations * 2, 0) * 0.15) +
-        (100 - economic_oversight * 0.15) +
-        (effectiveness_score * 0.5)
-    )
-    return min(score / 1.5, 100)
-
-def calculate_effectiveness_score(communication, transparency, responsiveness, policy_impact, citizen_satisfaction):
-    """Calculate effectiveness score based on qualitative metrics."""
-    return (communication + transparency + responsiveness + policy_impact + citizen_satisfaction) / 5 * 20
-
 # Export functions
 def convert_to_csv(data):
     return data.to_csv(index=False).encode('utf-8')
@@ -101,7 +59,7 @@ def convert_to_xml(data):
 
 def convert_to_pdf(data):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
+    p = canvas.Canvas(buffer, pagesize=pagesizes.letter)
     p.setFont("Helvetica", 12)
     y_position = 750
     for key, value in data.items():
@@ -206,8 +164,10 @@ with tab2:
     current_governance = st.text_area("Current Areas of Governance", value="Road maintenance, public parks, waste management.")
     suggested_governance = st.text_area("Suggested Areas of Governance", value="Renewable energy infrastructure, smart city development.")
     st.subheader("Governing Regulations")
-    num_regulations = st.number_input("Number of regulations", min_value=0, value=3)
-    regulations = [st.text_input(f"Regulation {i + 1}", value=f"Regulation {i + 1}") for i in range(num_regulations)]
+    regulations = regulations_editor(["Regulation 1", "Regulation 2", "Regulation 3"])
+    num_regulations = len(regulations)
+    st.caption(f"{num_regulations} regulations")
+    regulations_import()
 
     col1, col2 = st.columns(2)
 
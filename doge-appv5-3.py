@@ -1,13 +1,10 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import json
-import xml.etree.ElementTree as ET
-from io import BytesIO, StringIO
-import requests
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from app_common import LazyModule, parse_uploaded_file, show_data_preview, load_github_csv
+
+# Lazy Imports
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
 
 # Set page config
 st.set_page_config(
@@ -22,14 +19,6 @@ if 'total_weight' not in st.session_state:
 if 'selected_agency' not in st.session_state:
     st.session_state.selected_agency = None
 
-# Cache data loading function
-@st.cache_data
-def load_github_csv(url):
-    response = requests.get(url)
-    response.raise_for_status()
-    csv_data = response.content.decode('utf-8')
-    return pd.read_csv(StringIO(csv_data))
-
 # Define efficiency categories
 efficiency_categories = {
     "Operational Efficiency": {
@@ -58,48 +47,6 @@ efficiency_categories = {
     }
 }
 
-# File parsing functions
-def parse_uploaded_file(file):
-    if file is None:
-        return None
-    try:
-        file_extension = file.name.split('.')[-1].lower()
-        if file_extension == "csv":
-            df = pd.read_csv(file)
-            st.sidebar.success("CSV file loaded successfully")
-            return df
-        elif file_extension == "json":
-            data = json.load(file)
-            st.sidebar.success("JSON file loaded successfully")
-            return pd.DataFrame(data)
-        elif file_extension == "xml":
-            tree = ET.parse(file)
-            root = tree.getroot()
-            data = [{child.tag: child.text for child in element} for element in root]
-            st.sidebar.success("XML file loaded successfully")
-            return pd.DataFrame(data)
-        else:
-            st.sidebar.error("Unsupported file format")
-            return None
-    except Exception as e:
-        st.sidebar.error(f"Failed to load file: {e}")
-        return None
-
-# Utility Functions
-def calculate_efficiency_score(employees, budget, utilization, oversight, num_regulations, economic_oversight, effectiveness_score):
-    score = (
-        (utilization * 0.3) +
-        ((100 - oversight) * 0.2) +
-        (min(2000 / employees, 100) * 0.2) +
-        (max(100 - num_regulations * 2, 0) * 0.15) +
-        (100 - economic_oversight * 0.15) +
-        (effectiveness_score * 0.5)
-    )
-    return min(score / 1.5, 100)
-
-def calculate_effectiveness_score(communication, transparency, responsiveness, policy_impact, citizen_satisfaction):
-    return (communication + transparency + responsiveness + policy_impact + citizen_satisfaction) / 5 * 20
-
 # Sidebar for data upload
 st.sidebar.header("Upload Data for Efficiency Calculator")
 uploaded_file = st.sidebar.file_uploader(
@@ -117,8 +64,7 @@ data_frame = uploaded_data if uploaded_data is not None else github_data
 st.title("Government Department Efficiency Calculator")
 
 if data_frame is not None:
-    st.write("Loaded Data Preview:")
-    st.dataframe(data_frame)
+    show_data_preview(data_frame, uploaded_file.file_id if uploaded_data is not None else github_url)
     
     # Department selection
     dropdown_column = st.selectbox(
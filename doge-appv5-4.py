@@ -1,13 +1,16 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import json
-import xml.etree.ElementTree as ET
-from io import BytesIO, StringIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-import requests
+from io import BytesIO
+from app_common import LazyModule, parse_uploaded_file, show_data_preview, load_github_csv, regulations_editor, regulations_import
+from scoring import calculate_efficiency_score, calculate_effectiveness_score
+
+# Lazy Imports
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
+ET = LazyModule("xml.etree.ElementTree")
+pagesizes = LazyModule("reportlab.lib.pagesizes")
+canvas = LazyModule("reportlab.pdfgen.canvas")
 
 # Set page config
 st.set_page_config(
@@ -50,49 +53,6 @@ efficiency_categories = {
     }
 }
 
-# File parsing functions
-def parse_uploaded_file(file):
-    if file is None:
-        return None
-    try:
-        file_extension = file.name.split('.')[-1].lower()
-        if file_extension == "csv":
-            df = pd.read_csv(file)
-            st.sidebar.success("CSV file loaded successfully")
-            return df
-        elif file_extension == "json":
-            data = json.load(file)
-            st.sidebar.success("JSON file loaded successfully")
-            return pd.DataFrame(data)
-        elif file_extension == "xml":
-            tree = ET.parse(file)
-            root = tree.getroot()
-            data = [{child.tag: child.text for child in element}
-                    for element in root]
-            st.sidebar.success("XML file loaded successfully")
-            return pd.DataFrame(data)
-        else:
-            st.sidebar.error("Unsupported file format")
-            return None
-    except Exception as e:
-        st.sidebar.error(f"Failed to load file: {e}")
-        return None
-
-# Utility Functions
-def calculate_efficiency_score(employees, budget, utilization, oversight, num_regulations, economic_oversight, effectiveness_score):
-    score = (
-        (utilization * 0.3) +
-        ((100 - oversight) * 0.2) +
-        (min(2000 / employees, 100) * 0.2) +
-        (max(100 - num_regulations * 2, 0) * 0.15) +
-        (100 - economic_oversight * 0.15) +
-        (effectiveness_score * 0.5)
-    )
-    return min(score / 1.5, 100)
-
-def calculate_effectiveness_score(communication, transparency, responsiveness, policy_impact, citizen_satisfaction):
-    return (communication + transparency + responsiveness + policy_impact + citizen_satisfaction) / 5 * 20
-
 # Export Functions
 def convert_to_csv(data):
     return data.to_csv(index=False).encode('utf-8')
@@ -109,7 +69,7 @@ def convert_to_xml(data):
 
 def convert_to_pdf(data):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
+    p = canvas.Canvas(buffer, pagesize=pagesizes.letter)
     p.setFont("Helvetica", 12)
     y_position = 750
     for key, value in data.items():
@@ -129,13 +89,6 @@ uploaded_file = st.sidebar.file_uploader(
 
 # Load default data
 github_url = "https://raw.githubusercontent.com/SimpleMobileResponsiveWebsites/department-of-government-effiency-app-version-1/main/agenices_list_1.csv"
-@st.cache_data
-def load_github_csv(url):
-    response = requests.get(url)
-    response.raise_for_status()
-    csv_data = response.content.decode('utf-8')
-    return pd.read_csv(StringIO(csv_data))
-
 github_data = load_github_csv(github_url)
 uploaded_data = parse_uploaded_file(uploaded_file)
 data_frame = uploaded_data if uploaded_data is not None else github_data
@@ -144,8 +97,7 @@ data_frame = uploaded_data if uploaded_data is not None else github_data
 st.title("Government Department Efficiency Calculator")
 
 if data_frame is not None:
-    st.write("Loaded Data Preview:")
-    st.dataframe(data_frame)
+    show_data_preview(data_frame, uploaded_file.file_id if uploaded_data is not None else github_url)
 
     # Department selection
     dropdown_column = st.selectbox(
@@ -251,10 +203,10 @@ if data_frame is not None:
 
         # Governing Regulations
         st.subheader("Governing Regulations")
-        num_regulations = st.number_input("Number of regulations", min_value=0, value=3)
-        regulations = []
-        for i in range(num_regulations):
-            regulations.append(st.text_input(f"Regulation {i + 1}", value=f"Regulation {i + 1}"))
+        regulations = regulations_editor(["Regulation 1", "Regulation 2", "Regulation 3"])
+        num_regulations = len(regulations)
+        st.caption(f"{num_regulations} regulations")
+        regulations_import()
 
         # Budget and Oversight
         col1, col2 = st.columns(2)
@@ -1,13 +1,12 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import json
-import xml.etree.ElementTree as ET
 from io import BytesIO, StringIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-import requests
+from app_common import LazyModule
+
+# Lazy Imports
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
 
 # Set page config
 st.set_page_config(
@@ -203,6 +202,45 @@ def calculate_category_score(category_data, selected_metrics):
     weighted_score = sum(s * w for s, w in zip(scores, weights)) / sum(weights)
     return weighted_score
 
+# Figures are cached per score vector; px.bar only runs once, for the zero-score templates,
+# and each new score vector copies a template and fills in its trace data
+CHART_CACHE_ENTRIES = 256
+
+@st.cache_resource
+def get_chart_templates(categories):
+    fig_radar = go.Figure(data=go.Scatterpolar(
+        r=[0] * len(categories),
+        theta=list(categories),
+        fill='toself'
+    ))
+    fig_radar.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        showlegend=False,
+        title="Efficiency Radar Chart"
+    )
+
+    df_scores = pd.DataFrame({
+        'Category': list(categories),
+        'Score': [0] * len(categories)
+    })
+    fig_bar = px.bar(
+        df_scores,
+        x='Category',
+        y='Score',
+        title="Category Scores Comparison"
+    )
+    fig_bar.update_layout(yaxis_range=[0, 100])
+    return fig_radar, fig_bar
+
+@st.cache_resource(max_entries=CHART_CACHE_ENTRIES)
+def build_charts(categories, values):
+    radar_template, bar_template = get_chart_templates(categories)
+    fig_radar = go.Figure(radar_template)
+    fig_radar.data[0].r = values
+    fig_bar = go.Figure(bar_template)
+    fig_bar.data[0].y = values
+    return fig_radar, fig_bar
+
 def main():
     st.title("Enhanced Government Department Efficiency Calculator")
     
@@ -273,43 +311,16 @@ def main():
     with tab3:
         st.header("Efficiency Visualizations")
         
+        fig_radar, fig_bar = build_charts(tuple(category_scores.keys()), tuple(category_scores.values()))
         col1, col2 = st.columns(2)
         
         with col1:
             # Radar Chart
-            categories = list(category_scores.keys())
-            values = list(category_scores.values())
-            
-            fig = go.Figure(data=go.Scatterpolar(
-                r=values,
-                theta=categories,
-                fill='toself'
-            ))
-            
-            fig.update_layout(
-                polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-                showlegend=False,
-                title="Efficiency Radar Chart"
-            )
-            
-            st.plotly_chart(fig)
+            st.plotly_chart(fig_radar)
         
         with col2:
             # Bar Chart
-            df_scores = pd.DataFrame({
-                'Category': categories,
-                'Score': values
-            })
-            
-            fig = px.bar(
-                df_scores,
-                x='Category',
-                y='Score',
-                title="Category Scores Comparison"
-            )
-            
-            fig.update_layout(yaxis_range=[0, 100])
-            st.plotly_chart(fig)
+            st.plotly_chart(fig_bar)
 
 if __name__ == "__main__":
     main()
@@ -1,12 +1,16 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import json
-import xml.etree.ElementTree as ET
 from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from app_common import LazyModule, regulations_editor, regulations_import
+from scoring import calculate_efficiency_score, calculate_effectiveness_score
+
+# Lazy Imports
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
+ET = LazyModule("xml.etree.ElementTree")
+pagesizes = LazyModule("reportlab.lib.pagesizes")
+canvas = LazyModule("reportlab.pdfgen.canvas")
 
 # Set page config
 st.set_page_config(
@@ -53,21 +57,6 @@ efficiency_categories = {
     }
 }
 
-# Utility Functions
-def calculate_efficiency_score(employees, budget, utilization, oversight, num_regulations, economic_oversight, effectiveness_score):
-    score = (
-        (utilization * 0.3) +
-        ((100 - oversight) * 0.2) +
-        (min(2000 / employees, 100) * 0.2) +
-        (max(100 - num_regulations * 2, 0) * 0.15) +
-        (100 - economic_oversight * 0.15) +
-        (effectiveness_score * 0.5)
-    )
-    return min(score / 1.5, 100)
-
-def calculate_effectiveness_score(communication, transparency, responsiveness, policy_impact, citizen_satisfaction):
-    return (communication + transparency + responsiveness + policy_impact + citizen_satisfaction) / 5 * 20
-
 # Export Functions
 def convert_to_csv(data):
     return data.to_csv(index=False).encode('utf-8')
@@ -84,7 +73,7 @@ def convert_to_xml(data):
 
 def convert_to_pdf(data):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
+    p = canvas.Canvas(buffer, pagesize=pagesizes.letter)
     p.setFont("Helvetica", 12)
     y_position = 750
     for key, value in data.items():
@@ -191,10 +180,10 @@ with tab2:
     
     # Governing Regulations
     st.subheader("Governing Regulations")
-    num_regulations = st.number_input("Number of regulations", min_value=0, value=3)
-    regulations = []
-    for i in range(num_regulations):
-        regulations.append(st.text_input(f"Regulation {i + 1}", value=f"Regulation {i + 1}"))
+    regulations = regulations_editor(["Regulation 1", "Regulation 2", "Regulation 3"])
+    num_regulations = len(regulations)
+    st.caption(f"{num_regulations} regulations")
+    regulations_import()
     
     # Budget and Oversight
     col1, col2 = st.columns(2)
@@ -2,6 +2,11 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, date
 import json
+import os
+import sqlite3
+import threading
+import io
+from types import MappingProxyType
 
 # Define the government structure
 government_agencies = {
@@ -29,6 +34,98 @@ government_agencies = {
     }
 }
 
+# Agency Hierarchy
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+AGENCY_DATA_PATH = os.environ.get("AGENCY_DATA_PATH", os.path.join(APP_DIR, "downloaded_data (5).csv"))
+AGENCY_LIST_PATH = os.environ.get("AGENCY_LIST_PATH", os.path.join(APP_DIR, "agenices_list_1.csv"))
+HIERARCHY_ROOT = ""
+OTHER_AGENCIES = "Other Agencies"
+PATH_SEPARATOR = " / "
+
+def hierarchy_from_tree(data, parent=HIERARCHY_ROOT, children=None):
+    """Children lists for the built-in nested agency dict, used when no agency dataset is available"""
+    children = {} if children is None else children
+    if isinstance(data, dict):
+        # Branch names repeat between governments, so branch nodes are keyed by their full path
+        nodes = [f"{parent}{PATH_SEPARATOR}{key}" if parent else key for key in data]
+        children[parent] = nodes
+        for node, value in zip(nodes, data.values()):
+            hierarchy_from_tree(value, node, children)
+    else:
+        children[parent] = list(data)
+    return children
+
+def hierarchy_from_dataset(agencies, agency_names):
+    """Children lists from the agency dataset: agency types at the top, sub-agencies under their parent department"""
+    departments = {}
+    for name in agencies["department_name"]:
+        # "Parent Department" holds short names such as "Defense" or "Interior"
+        if name.startswith("Department of "):
+            short_name = name[len("Department of "):]
+            departments[short_name[len("the "):] if short_name.startswith("the ") else short_name] = name
+    children = {HIERARCHY_ROOT: []}
+    for name, agency_type, parent_name in zip(agencies["department_name"], agencies["Type"], agencies["Parent Department"]):
+        parent = departments.get(parent_name)
+        if parent is None:
+            parent = agency_type
+            if parent not in children:
+                children[HIERARCHY_ROOT].append(parent)
+        children.setdefault(parent, []).append(name)
+    listed = set(agencies["department_name"])
+    others = [name for name in agency_names if name not in listed]
+    if others:
+        children[HIERARCHY_ROOT].append(OTHER_AGENCIES)
+        children[OTHER_AGENCIES] = others
+    return children
+
+def read_agency_files():
+    """Raw bytes of the agency dataset and agency list, or None when the dataset is missing"""
+    try:
+        with open(AGENCY_DATA_PATH, "rb") as data_file:
+            dataset = data_file.read()
+    except OSError:
+        return None
+    try:
+        with open(AGENCY_LIST_PATH, "rb") as list_file:
+            agency_list = list_file.read()
+    except OSError:
+        agency_list = b""
+    return dataset, agency_list
+
+def file_signature(path):
+    """(path, mtime_ns, size) of a file, or None when it cannot be read"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+@st.cache_resource(max_entries=4)
+def get_hierarchy_index(dataset_signature, agency_list_signature):
+    """Adjacency index built once per version of the agency files: node -> options for the next dropdown level.
+
+    The files are read only here, on a cache miss. Agencies that have sub-agencies list themselves
+    first, so the agency itself stays selectable.
+    """
+    agency_files = read_agency_files() if dataset_signature is not None else None
+    if agency_files is None:
+        children = hierarchy_from_tree(government_agencies)
+        groups = set(children)
+    else:
+        dataset, agency_list = agency_files
+        agencies = pd.read_csv(io.BytesIO(dataset), dtype=str).fillna("")
+        agency_names = [line.strip() for line in agency_list.decode("utf-8").splitlines()[1:] if line.strip()]
+        children = hierarchy_from_dataset(agencies, agency_names)
+        groups = {HIERARCHY_ROOT, OTHER_AGENCIES, *agencies["Type"]}
+    return MappingProxyType({
+        node: tuple(options) if node in groups else (node, *options)
+        for node, options in children.items()
+    })
+
+def load_hierarchy_index():
+    """Cached adjacency index for the agency files as they are on disk now; a rerun only stats them"""
+    return get_hierarchy_index(file_signature(AGENCY_DATA_PATH), file_signature(AGENCY_LIST_PATH))
+
 def calculate_efficiency_metrics(efficiency_score, budget_utilization, service_quality, processing_time):
     """Calculate overall efficiency based on multiple metrics"""
     weights = {
@@ -47,6 +144,68 @@ def calculate_efficiency_metrics(efficiency_score, budget_utilization, service_q
     
     return round(overall_score, 2)
 
+# Records read per batch when exporting; the store lock is released between batches
+EXPORT_BATCH_SIZE = 500
+
+class AgencyStore:
+    """Agency records kept in SQLite and read one agency at a time"""
+
+    EXPORT_FIRST_SQL = "SELECT name, record FROM agencies ORDER BY name LIMIT ?"
+    EXPORT_NEXT_SQL = "SELECT name, record FROM agencies WHERE name > ? ORDER BY name LIMIT ?"
+
+    def __init__(self, db_path="agency_data.db"):
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS agencies (name TEXT PRIMARY KEY, record TEXT NOT NULL)"
+            )
+
+    def get(self, name):
+        with self.lock:
+            row = self.connection.execute("SELECT record FROM agencies WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def save(self, name, record):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO agencies (name, record) VALUES (?, ?)",
+                (name, json.dumps(record))
+            )
+
+    def iter_export_json(self, batch_size=EXPORT_BATCH_SIZE):
+        """Yield the JSON export in chunks, reading batch_size records per hold of the lock
+
+        Batches are read in name order from after the last name already exported, so
+        saves made between batches block neither side and no record is skipped or repeated.
+        """
+        yield b"{"
+        last_name = None
+        while True:
+            with self.lock:
+                if last_name is None:
+                    rows = self.connection.execute(self.EXPORT_FIRST_SQL, (batch_size,)).fetchall()
+                else:
+                    rows = self.connection.execute(self.EXPORT_NEXT_SQL, (last_name, batch_size)).fetchall()
+            if not rows:
+                break
+            # Records are stored as JSON text, so they are copied through without re-encoding
+            yield "".join(
+                f'{"," if last_name is not None or index else ""}\n  {json.dumps(name)}: {record}'
+                for index, (name, record) in enumerate(rows)
+            ).encode("utf-8")
+            last_name = rows[-1][0]
+        yield b"\n}"
+
+    def export_json(self):
+        """JSON object of every record, as bytes for st.download_button"""
+        return b"".join(self.iter_export_json())
+
+@st.cache_resource
+def get_agency_store():
+    return AgencyStore(os.environ.get("AGENCY_DB_PATH", "agency_data.db"))
+
 def main():
     st.set_page_config(page_title="Government Efficiency Analyzer", layout="wide")
     
@@ -57,9 +216,11 @@ def main():
     across different metrics and organizational levels.
     """)
     
-    # Initialize session state for storing agency data
-    if 'agency_data' not in st.session_state:
-        st.session_state.agency_data = {}
+    # Only the selected agency's record is kept in session state
+    store = get_agency_store()
+    if 'agency_record_name' not in st.session_state:
+        st.session_state.agency_record_name = None
+        st.session_state.agency_record = {}
     
     # Create columns for layout
     col1, col2 = st.columns([1, 2])
@@ -67,26 +228,34 @@ def main():
     with col1:
         st.subheader("Agency Selection")
         
-        def create_dropdown(data, level=0):
-            if isinstance(data, dict):
-                options = list(data.keys())
-                key = f"level_{level}"
-                selected = st.selectbox(f"Level {level + 1}", options, key=key)
-                
-                if selected:
-                    return create_dropdown(data[selected], level + 1)
-                return None
-            
-            elif isinstance(data, list):
-                selected_agency = st.selectbox(f"Level {level + 1}", data)
-                return selected_agency
-            
-            return None
+        def create_dropdown(index):
+            # Each level is one lookup in the adjacency index, however deep the hierarchy goes
+            node, level = HIERARCHY_ROOT, 0
+            while node in index:
+                options = index[node]
+                selected = st.selectbox(
+                    f"Level {level + 1}",
+                    options,
+                    # Keyed by parent so a selection never outlives a change higher up
+                    key=f"level_{node}",
+                    format_func=lambda option, parent=node: (
+                        f"{option} (whole agency)" if option == parent else option.rpartition(PATH_SEPARATOR)[2]
+                    )
+                )
+                if selected is None or selected == node:
+                    return selected
+                node, level = selected, level + 1
+            return node
         
-        selected_agency = create_dropdown(government_agencies)
+        selected_agency = create_dropdown(load_hierarchy_index())
     
     with col2:
         if selected_agency:
+            if st.session_state.agency_record_name != selected_agency:
+                st.session_state.agency_record = store.get(selected_agency)
+                st.session_state.agency_record_name = selected_agency
+            agency_record = st.session_state.agency_record
+            
             st.subheader(f"Efficiency Analysis for: {selected_agency}")
             
             # Create tabs for different aspects of analysis
@@ -96,22 +265,22 @@ def main():
             with tabs[0]:
                 description = st.text_area(
                     "Agency Description",
-                    value=st.session_state.agency_data.get(selected_agency, {}).get('description', ''),
+                    value=agency_record.get('description', ''),
                     height=100
                 )
                 
                 mandate = st.text_area(
                     "Agency Mandate",
-                    value=st.session_state.agency_data.get(selected_agency, {}).get('mandate', ''),
+                    value=agency_record.get('mandate', ''),
                     height=100
                 )
                 
                 established_date = st.date_input(
                     "Date Established",
                     value=datetime.strptime(
-                        st.session_state.agency_data.get(selected_agency, {}).get('established_date', '2000-01-01'),
+                        agency_record.get('established_date', '2000-01-01'),
                         '%Y-%m-%d'
-                    ).date() if selected_agency in st.session_state.agency_data else date(2000, 1, 1)
+                    ).date() if agency_record else date(2000, 1, 1)
                 )
             
             # Efficiency Metrics Tab
@@ -122,26 +291,26 @@ def main():
                     efficiency_score = st.slider(
                         "Overall Efficiency Score (1-10)",
                         1, 10,
-                        value=st.session_state.agency_data.get(selected_agency, {}).get('efficiency_score', 5)
+                        value=agency_record.get('efficiency_score', 5)
                     )
                     
                     budget_utilization = st.slider(
                         "Budget Utilization Efficiency (1-10)",
                         1, 10,
-                        value=st.session_state.agency_data.get(selected_agency, {}).get('budget_utilization', 5)
+                        value=agency_record.get('budget_utilization', 5)
                     )
                 
                 with col2:
                     service_quality = st.slider(
                         "Service Quality Rating (1-10)",
                         1, 10,
-                        value=st.session_state.agency_data.get(selected_agency, {}).get('service_quality', 5)
+                        value=agency_record.get('service_quality', 5)
                     )
                     
                     processing_time = st.slider(
                         "Processing Time Efficiency (1-10)",
                         1, 10,
-                        value=st.session_state.agency_data.get(selected_agency, {}).get('processing_time', 5)
+                        value=agency_record.get('processing_time', 5)
                     )
                 
                 overall_efficiency = calculate_efficiency_metrics(
@@ -172,7 +341,7 @@ def main():
             
             # Save button
             if st.button("Save Agency Data"):
-                st.session_state.agency_data[selected_agency] = {
+                agency_record = {
                     'description': description,
                     'mandate': mandate,
                     'established_date': established_date.strftime('%Y-%m-%d'),
@@ -182,13 +351,15 @@ def main():
                     'processing_time': processing_time,
                     'overall_efficiency': overall_efficiency
                 }
+                store.save(selected_agency, agency_record)
+                st.session_state.agency_record = agency_record
                 st.success(f"Data saved for {selected_agency}")
             
             # Export functionality
             if st.button("Export Data"):
                 st.download_button(
                     label="Download Agency Data",
-                    data=json.dumps(st.session_state.agency_data, indent=2),
+                    data=store.export_json(),
                     file_name="government_efficiency_data.json",
                     mime="application/json"
                 )
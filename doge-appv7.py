@@ -2,12 +2,14 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import altair as alt
 import json
-import xml.etree.ElementTree as ET
 from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from app_common import LazyModule, read_only_frame
+
+# Lazy Imports
+ET = LazyModule("xml.etree.ElementTree")
+pagesizes = LazyModule("reportlab.lib.pagesizes")
+canvas = LazyModule("reportlab.pdfgen.canvas")
 
 # Government Agencies Dataset
 agency_data = [
@@ -23,24 +25,12 @@ agency_data = [
     {"Agency Name": "Social Security Administration", "Type": "Independent Agency", "Parent Department": "", "Category": "Social Services", "Acronym": "SSA"}
 ]
 
-# Convert to DataFrame
-agency_df = pd.DataFrame(agency_data)
-
-# Function to calculate efficiency score
-def calculate_efficiency_score(employees, budget, utilization, oversight, num_regulations, economic_oversight, effectiveness_score):
-    score = (
-        (utilization * 0.3) +
-        ((100 - oversight) * 0.2) +
-        (min(2000 / employees, 100) * 0.2) +
-        (max(100 - num_regulations * 2, 0) * 0.15) +
-        (100 - economic_oversight * 0.15) +
-        (effectiveness_score * 0.5)
-    )
-    return min(score / 1.5, 100)
+# Convert to DataFrame once per process; each session gets a shallow copy of the read-only frame
+@st.cache_resource
+def get_agency_df():
+    return read_only_frame(pd.DataFrame(agency_data))
 
-# Calculate qualitative effectiveness score
-def calculate_effectiveness_score(communication, transparency, responsiveness, policy_impact, citizen_satisfaction):
-    return (communication + transparency + responsiveness + policy_impact + citizen_satisfaction) / 5 * 20
+agency_df = get_agency_df().copy(deep=False)
 
 # Convert data to CSV
 def convert_to_csv(data):
@@ -63,7 +53,7 @@ def convert_to_xml(data):
 # Convert data to PDF
 def convert_to_pdf(data):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
+    p = canvas.Canvas(buffer, pagesize=pagesizes.letter)
     p.setFont("Helvetica", 10)
     y_position = 750
     p.drawString(30, y_position, "Government Agencies Report")
@@ -0,0 +1,1066 @@
+import argparse
+import contextlib
+import importlib.util
+import os
+import random
+import re
+import time
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Efficiency categories and metrics used by the assessment apps
+EFFICIENCY_CATEGORIES = {
+    "Operational Efficiency": ["Process Optimization", "Resource Utilization", "Service Delivery Speed", "Digital Transformation"],
+    "Fiscal Efficiency": ["Budget Management", "Cost Control", "Resource Allocation", "Financial Transparency"],
+    "Administrative Efficiency": ["Paperwork Processing", "Response Time", "Staff Productivity", "Regulatory Compliance"],
+    "Public Service Efficiency": ["Citizen Satisfaction", "Service Accessibility", "Communication Effectiveness", "Public Engagement"]
+}
+
+def load_app(file_name):
+    """Import an app script by file name so its helper functions can be benchmarked"""
+    path = os.path.join(REPO_DIR, file_name)
+    module_name = os.path.splitext(file_name)[0].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Modules the apps import from; they use streamlit but are not apps themselves
+SHARED_MODULES = {"app_common.py"}
+
+def streamlit_apps():
+    """Scripts in the repository that import streamlit at the top level, i.e. the apps the benchmarks can run"""
+    apps = []
+    for name in sorted(os.listdir(REPO_DIR)):
+        if not name.endswith(".py") or name in SHARED_MODULES:
+            continue
+        with open(os.path.join(REPO_DIR, name), encoding="utf-8") as f:
+            if re.search(r"^(import|from) streamlit\b", f.read(), re.MULTILINE):
+                apps.append(name)
+    return apps
+
+def sample_assessment(rng, index):
+    """Build one department assessment shaped like the doge-appv5-1.py export"""
+    detailed_metrics = {
+        category: {metric: rng.randint(0, 25) for metric in metrics}
+        for category, metrics in EFFICIENCY_CATEGORIES.items()
+    }
+    return {
+        "Department Name": f"Department {index}",
+        "Description": "Handles infrastructure and public works projects.",
+        "Employees": rng.randint(1, 100000),
+        "Current Governance": "Road maintenance, public parks, waste management.",
+        "Suggested Governance": "Renewable energy infrastructure, smart city development.",
+        "Regulations": "Regulation 1, Regulation 2, Regulation 3",
+        "Budget (Million USD)": round(rng.uniform(1, 5000), 2),
+        "Budget Utilization (%)": rng.randint(0, 100),
+        "Regulatory Oversight (%)": rng.randint(0, 100),
+        "Economic Oversight (%)": rng.randint(0, 100),
+        "Effectiveness Score": rng.choice([20.0, 40.0, 60.0, 80.0, 100.0]),
+        "Efficiency Score": round(rng.uniform(0, 100), 2),
+        "Category Scores": {category: sum(values.values()) for category, values in detailed_metrics.items()},
+        "Detailed Metrics": detailed_metrics
+    }
+
+def time_call(func, repeat=3):
+    """Return the best wall time of several calls together with the last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def print_table(headers, rows):
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    print(" | ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("-|-".join("-" * w for w in widths))
+    for row in rows:
+        print(" | ".join(str(v).ljust(w) for v, w in zip(row, widths)))
+
+# Benchmarks
+def bench_exports(args):
+    """Size and speed of every export format for a table of historical assessments"""
+    import pandas as pd
+
+    app = load_app("doge-appv5-1.py")
+    rng = random.Random(args.seed)
+    records = [sample_assessment(rng, i) for i in range(args.records)]
+    frame = pd.DataFrame([app.flatten_export_data(record) for record in records])
+
+    formats = {
+        "CSV": lambda: app.convert_to_csv(frame),
+        "CSV (gzip)": lambda: app.compress_export(app.convert_to_csv(frame), "gzip"),
+        "CSV (xz)": lambda: app.compress_export(app.convert_to_csv(frame), "xz"),
+        "JSON": lambda: app.convert_to_json(records),
+        "JSON (compact)": lambda: app.convert_to_json(records, compact=True),
+        "JSON (compact, gzip)": lambda: app.compress_export(app.convert_to_json(records, compact=True), "gzip"),
+        "JSON (compact, xz)": lambda: app.compress_export(app.convert_to_json(records, compact=True), "xz"),
+        "Parquet": lambda: app.convert_to_parquet(frame)
+    }
+
+    baseline = None
+    rows = []
+    for name, build in formats.items():
+        try:
+            elapsed, data = time_call(build, repeat=args.repeat)
+        except ImportError as e:
+            rows.append([name, "-", "-", "-", f"skipped ({e})"])
+            continue
+        if data is None:
+            rows.append([name, "-", "-", "-", "skipped (pyarrow is not installed)"])
+            continue
+        size = len(data)
+        baseline = baseline or size
+        rows.append([name, f"{size / 1024:,.1f}", f"{size / baseline:.2f}", f"{elapsed * 1000:,.1f}", ""])
+
+    print(f"Export formats for {args.records:,} assessments")
+    print_table(["Format", "Size (KiB)", "Size vs CSV", "Time (ms)", "Notes"], rows)
+
+def bench_snapshot(args):
+    """Save/load time and size of the binary session snapshot against the JSON export"""
+    import json
+
+    app = load_app("doge-appv4.py")
+    rng = random.Random(args.seed)
+    assessments = []
+    for i in range(args.assessments):
+        metric_scores = {
+            category: {metric: rng.randint(0, 25) for metric in metrics}
+            for category, metrics in app.EFFICIENCY_CATEGORIES.items()
+        }
+        category_scores = {category: app.calculate_category_score(metrics) for category, metrics in metric_scores.items()}
+        assessments.append({
+            "id": f"{i:08d}-0000-0000-0000-000000000000",
+            "company_name": f"Company {i % 500}",
+            "date": f"20{10 + i % 15:02d}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            "overall_efficiency": app.calculate_overall_efficiency(category_scores),
+            "category_scores": category_scores,
+            "metric_scores": metric_scores
+        })
+
+    history = app.HistoryColumns.from_assessments(assessments)
+    formats = {
+        "JSON (indent=2)": (lambda: json.dumps(assessments, indent=2).encode("utf-8"), json.loads),
+        "JSON (compact)": (lambda: json.dumps(assessments, separators=(",", ":")).encode("utf-8"), json.loads),
+        "Binary snapshot": (lambda: app.save_snapshot(history), app.load_snapshot)
+    }
+
+    rows = []
+    for name, (save, load) in formats.items():
+        save_time, data = time_call(save, repeat=args.repeat)
+        load_time, _ = time_call(lambda: load(data), repeat=args.repeat)
+        rows.append([name, f"{len(data) / 1024 / 1024:,.1f}", f"{save_time * 1000:,.0f}", f"{load_time * 1000:,.0f}"])
+
+    print(f"Session snapshot for {args.assessments:,} assessments")
+    print_table(["Format", "Size (MiB)", "Save (ms)", "Load (ms)"], rows)
+
+class BenchSessionState(dict):
+    """Stand-in for st.session_state so app classes can run outside `streamlit run`"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+class NullTaskStore:
+    """Task store that persists nothing, so benchmarks measure only in-memory work"""
+
+    def load(self):
+        return [], None, None
+
+    def record(self, entry, version):
+        return True, None, []
+
+    def changed_since(self, version):
+        return False
+
+    def needs_compaction(self):
+        return False
+
+def bench_tasks(args):
+    """Cost of one task list rerun (a lookup per rendered task) and of bulk deletes"""
+    from types import SimpleNamespace
+
+    app = load_app("efficiencycalculator.py")
+    app.st = SimpleNamespace(session_state=BenchSessionState(), error=print)
+
+    tracker = app.EfficiencyTracker(store=NullTaskStore())
+    app.st.session_state.task_counters = app.TaskCounters()
+    for i in range(args.tasks):
+        # Fixed ids: add_task uses a timestamp, which repeats inside a tight loop
+        task = {'id': float(i), 'text': f"Task {i}", 'completed': False, 'created_at': "2024-01-01T00:00:00", 'completed_at': None}
+        app.st.session_state.tasks[task['id']] = task
+        app.st.session_state.task_counters.add(task)
+    ids = list(app.st.session_state.tasks)
+    task_list = list(app.st.session_state.tasks.values())
+
+    def list_rerun():
+        # Previous behaviour: every edit_task call scanned the whole task list
+        for task_id in ids:
+            for task in task_list:
+                if task['id'] == task_id:
+                    task['text'] = task['text']
+
+    def indexed_rerun():
+        for task_id in ids:
+            tracker.edit_task(task_id, app.st.session_state.tasks[task_id]['text'])
+
+    def indexed_deletes():
+        for task_id in ids[:args.deletes]:
+            tracker.delete_task(task_id)
+
+    rows = []
+    list_time, _ = time_call(list_rerun, repeat=1)
+    indexed_time, _ = time_call(indexed_rerun, repeat=args.repeat)
+    delete_time, _ = time_call(indexed_deletes, repeat=1)
+    rows.append(["Rerun, list scan per task", f"{list_time * 1000:,.1f}"])
+    rows.append(["Rerun, id index", f"{indexed_time * 1000:,.1f}"])
+    rows.append([f"Delete {args.deletes:,} tasks, id index", f"{delete_time * 1000:,.1f}"])
+
+    print(f"Task list operations for {args.tasks:,} tasks")
+    print_table(["Operation", "Time (ms)"], rows)
+
+STRESS_SHARED_TASKS = 10
+
+def stress_writer(app, store, writer, operations, barrier, results):
+    """One concurrent session: add tasks, complete every other one, rename a shared task
+    and compact when due, keeping its own copy of the tasks the way EfficiencyTracker does"""
+    tasks, counters, version = store.load()
+    tasks = {task['id']: task for task in tasks}
+    reloads = retries = 0
+
+    def record(entry):
+        nonlocal tasks, counters, version, reloads, retries
+        while True:
+            written, version, missed = store.record(entry, version)
+            if missed is None:
+                tasks, counters, version = store.load()
+                tasks = {task['id']: task for task in tasks}
+                reloads += 1
+            else:
+                for missed_entry in missed:
+                    app.apply_task_entry(tasks, counters, missed_entry)
+                if written:
+                    app.apply_task_entry(tasks, counters, entry)
+            if written:
+                return
+            retries += 1
+
+    for i in range(operations):
+        task_id = float(writer * 1000000 + i)
+        record({'op': 'add', 'task': {
+            'id': task_id, 'text': f"Writer {writer} task {i}", 'completed': False,
+            'created_at': "2024-01-01T00:00:00", 'completed_at': None
+        }})
+        if i % 2 == 0:
+            record({'op': 'update', 'id': task_id, 'fields': {
+                'completed': True, 'completed_at': "2024-01-02T00:00:00"
+            }})
+        # Every writer renames the same few tasks, so the final text depends on the journal order
+        record({'op': 'update', 'id': float(-(i % STRESS_SHARED_TASKS) - 1), 'fields': {'text': f"Writer {writer} edit {i}"}})
+        if store.needs_compaction():
+            store.compact()
+
+    # Without compactions, every writer renames the same task once more, then catches up
+    # like a session would on its next write and compares its copy of the tasks with the store
+    barrier.wait()
+    record({'op': 'update', 'id': -1.0, 'fields': {'text': f"Writer {writer} final edit"}})
+    barrier.wait()
+    version, missed = store.entries_since(version)
+    if missed is None:
+        matches = None
+    else:
+        for missed_entry in missed:
+            app.apply_task_entry(tasks, counters, missed_entry)
+        stored_tasks, stored_counters, _ = store.load()
+        matches = tasks == {task['id']: task for task in stored_tasks} and counters.to_dict() == stored_counters.to_dict()
+    results.put((reloads, retries, matches))
+
+def bench_tasks_stress(args):
+    """Concurrent writers on one journal store: check for lost updates and that every
+    writer's copy of the tasks matches the store, and report throughput"""
+    import multiprocessing
+    import tempfile
+
+    app = load_app("efficiencycalculator.py")
+    with tempfile.TemporaryDirectory() as directory:
+        store = app.JournalTaskStore(
+            snapshot_path=os.path.join(directory, "tasks.json"),
+            journal_path=os.path.join(directory, "tasks.journal"),
+            compact_bytes=args.compact_kib * 1024
+        )
+        _, _, version = store.load()
+        for shared in range(STRESS_SHARED_TASKS):
+            _, version, _ = store.record({'op': 'add', 'task': {
+                'id': float(-shared - 1), 'text': f"Shared task {shared}", 'completed': False,
+                'created_at': "2024-01-01T00:00:00", 'completed_at': None
+            }}, version)
+        # Forked writers inherit the store, so nothing has to be pickled
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        barrier = context.Barrier(args.writers)
+        writers = [
+            context.Process(target=stress_writer, args=(app, store, writer, args.operations, barrier, results))
+            for writer in range(args.writers)
+        ]
+        start = time.perf_counter()
+        for process in writers:
+            process.start()
+        reports = [results.get() for _ in writers]
+        for process in writers:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        tasks, counters, _ = store.load()
+        tasks = {task['id']: task for task in tasks}
+
+    expected = {
+        float(writer * 1000000 + i): i % 2 == 0
+        for writer in range(args.writers) for i in range(args.operations)
+    }
+    missing = [task_id for task_id in expected if task_id not in tasks]
+    wrong_state = [task_id for task_id, completed in expected.items() if task_id in tasks and tasks[task_id]['completed'] != completed]
+    writes = (sum(3 if i % 2 == 0 else 2 for i in range(args.operations)) + 1) * args.writers
+    compared = [matches for _, _, matches in reports if matches is not None]
+    mismatched = compared.count(False)
+
+    print(f"{args.writers} concurrent writers, {writes:,} journal writes in {elapsed:.2f}s ({writes / elapsed:,.0f} writes/s)")
+    print_table(["Check", "Result"], [
+        ["Tasks expected", f"{len(expected) + STRESS_SHARED_TASKS:,}"],
+        ["Tasks missing", f"{len(missing):,}"],
+        ["Tasks with lost completion", f"{len(wrong_state):,}"],
+        ["Counter total / completed", f"{counters.total:,} / {counters.completed:,}"],
+        ["Writer copies compared / differing from the store", f"{len(compared):,} / {mismatched:,}"],
+        ["Writes retried after catching up", f"{sum(retries for _, retries, _ in reports):,}"],
+        ["Reloads after compaction", f"{sum(reloads for reloads, _, _ in reports):,}"]
+    ])
+    if missing or wrong_state or counters.total != len(expected) + STRESS_SHARED_TASKS or mismatched:
+        raise SystemExit("Lost updates detected" if not mismatched else "Writer copies differ from the store")
+
+def current_rss_mib():
+    """Resident set size of this process in MiB"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError):
+        import resource
+        # Peak rather than current RSS where /proc is unavailable
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def bench_sessions(args):
+    """Process RSS as more Streamlit sessions of one app are kept alive"""
+    import gc
+    from streamlit.testing.v1 import AppTest
+
+    path = os.path.join(REPO_DIR, args.app)
+    checkpoints = sorted(set(args.sessions))
+    sessions = []
+    gc.collect()
+    baseline = current_rss_mib()
+
+    rows = []
+    for target in checkpoints:
+        while len(sessions) < target:
+            session = AppTest.from_file(path, default_timeout=args.timeout)
+            session.run()
+            sessions.append(session)
+        gc.collect()
+        rss = current_rss_mib()
+        rows.append([target, f"{rss:,.1f}", f"{(rss - baseline) / target:,.2f}"])
+
+    print(f"Memory for concurrent sessions of {args.app} (baseline {baseline:,.1f} MiB)")
+    print_table(["Sessions", "RSS (MiB)", "Per session (MiB)"], rows)
+
+def bench_downsample(args):
+    """Figure payload and build time for a long history, raw against LTTB-downsampled"""
+    import numpy as np
+    import pandas as pd
+    import plotly.graph_objects as go
+
+    app = load_app("doge-appv4.py")
+    rng = np.random.default_rng(args.seed)
+    steps = rng.normal(0, 1.5, args.points).cumsum()
+    series = pd.Series(
+        np.clip(50 + steps, 0, 100),
+        index=pd.date_range("2000-01-01", periods=args.points, freq="h"),
+        name="Overall Efficiency"
+    )
+
+    cases = {
+        "Raw (go.Scatter)": lambda: go.Figure(go.Scatter(x=series.index, y=series.to_numpy(), mode="lines")).to_json(),
+        "Raw (go.Scattergl)": lambda: go.Figure(go.Scattergl(x=series.index, y=series.to_numpy(), mode="lines")).to_json(),
+        "LTTB to byte budget": lambda: app.build_history_figure(series).to_json(),
+        # A rerun of the same chart reuses the downsampled positions
+        "LTTB, cached positions": lambda: app.build_history_figure(series, chart_key=("Benchmark", args.points)).to_json()
+    }
+    rows = []
+    for name, build in cases.items():
+        elapsed, payload = time_call(build, repeat=args.repeat)
+        rows.append([name, f"{len(payload) / 1024:,.1f}", f"{elapsed * 1000:,.1f}"])
+
+    print(f"History chart for {args.points:,} points (budget {app.CHART_BYTE_BUDGET / 1024:,.0f} KiB)")
+    print_table(["Figure", "JSON (KiB)", "Build + serialize (ms)"], rows)
+
+# The task journal store writes to the working directory, so apps also run from data_dir
+def isolated_app_env(data_dir):
+    """Environment pointing the apps' SQLite stores into data_dir"""
+    return dict(
+        os.environ,
+        ASSESSMENT_DB_PATH=os.path.join(data_dir, "assessments.db"),
+        AGENCY_DB_PATH=os.path.join(data_dir, "agencies.db"),
+        TASK_STORE_PATH=os.path.join(data_dir, "tasks.db")
+    )
+
+# app_common.py helpers and the module each one defers for the apps that import it
+SHARED_LAZY_MODULES = {"load_github_csv": "requests", "parse_uploaded_file": "xml.etree.ElementTree"}
+
+def lazy_module_names(app):
+    """Modules an app defers with LazyModule, directly or through the app_common.py helpers it imports"""
+    with open(os.path.join(REPO_DIR, app)) as f:
+        source = f.read()
+    names = re.findall(r'LazyModule\("([^"]+)"\)', source)
+    shared = re.search(r"^from app_common import (.+)$", source, re.MULTILINE)
+    helpers = shared.group(1).split(", ") if shared else []
+    return names + [module for helper, module in SHARED_LAZY_MODULES.items() if helper in helpers and module not in names]
+
+def startup_child(args):
+    """One cold start in this fresh process, printed as a JSON line"""
+    import json
+    import streamlit.delta_generator as delta_generator
+    from streamlit.testing.v1 import AppTest
+
+    first_paint = []
+    enqueue = delta_generator.DeltaGenerator._enqueue
+    def timed_enqueue(self, *enqueue_args, **enqueue_kwargs):
+        if not first_paint:
+            first_paint.append(time.perf_counter())
+        return enqueue(self, *enqueue_args, **enqueue_kwargs)
+    delta_generator.DeltaGenerator._enqueue = timed_enqueue
+
+    # Eager mode imports the heavy modules up front, as the apps did before the shim
+    start = time.perf_counter()
+    if args.eager:
+        for name in lazy_module_names(args.app):
+            importlib.import_module(name)
+    imports = time.perf_counter() - start
+    AppTest.from_file(os.path.join(REPO_DIR, args.app), default_timeout=args.timeout).run()
+    finished = time.perf_counter()
+    print(json.dumps({
+        "imports": imports,
+        "first_paint": (first_paint[0] if first_paint else finished) - start,
+        "first_run": finished - start
+    }))
+
+def bench_startup(args):
+    """Import, first-paint and first-run time of each app, eager against lazy imports"""
+    import json
+    import subprocess
+    import sys
+    import tempfile
+
+    apps = args.apps or [name for name in streamlit_apps() if lazy_module_names(name)]
+    rows = []
+    for app in apps:
+        results = {}
+        for mode in ("eager", "lazy"):
+            command = [sys.executable, os.path.abspath(__file__), "startup-child", "--app", app, "--timeout", str(args.timeout)]
+            if mode == "eager":
+                command.append("--eager")
+            runs = []
+            for _ in range(args.repeat):
+                with tempfile.TemporaryDirectory() as data_dir:
+                    completed = subprocess.run(
+                        command, capture_output=True, text=True, cwd=data_dir, env=isolated_app_env(data_dir)
+                    )
+                if completed.returncode == 0:
+                    runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+            results[mode] = min(runs, key=lambda run: run["first_run"]) if runs else None
+        if results["eager"] is None or results["lazy"] is None:
+            rows.append([app, "-", "-", "-", "-", "-"])
+            continue
+        eager, lazy = results["eager"], results["lazy"]
+        rows.append([
+            app,
+            f"{eager['imports'] * 1000:,.0f}",
+            f"{eager['first_paint'] * 1000:,.0f}",
+            f"{lazy['first_paint'] * 1000:,.0f}",
+            f"{eager['first_run'] * 1000:,.0f}",
+            f"{lazy['first_run'] * 1000:,.0f}"
+        ])
+
+    print(f"Cold start per app, best of {args.repeat} fresh processes")
+    print_table(["App", "Imports (ms)", "First paint eager (ms)", "First paint lazy (ms)", "First run eager (ms)", "First run lazy (ms)"], rows)
+
+# Buttons the suite clicks: exports and prepared downloads, never deletes or restores
+SUITE_BUTTON_WORDS = ("Export", "Prepare", "Calculate", "Generate")
+SUITE_UPLOAD_FILE = "downloaded_data (5).csv"
+
+def suite_child(args):
+    """Drive one app through its scripted interactions in this fresh process, printed as a JSON line"""
+    import json
+    import resource
+    from streamlit.testing.v1 import AppTest
+
+    session = AppTest.from_file(os.path.join(REPO_DIR, args.app), default_timeout=args.timeout)
+    start = time.perf_counter()
+    session.run()
+    cold_start = time.perf_counter() - start
+
+    reruns = []
+    interactions = []
+    exceptions = [str(e.value) for e in session.exception]
+    def rerun(label, widget_action):
+        started = time.perf_counter()
+        widget_action.run()
+        reruns.append(time.perf_counter() - started)
+        interactions.append(label)
+        exceptions.extend(f"{label}: {e.value}" for e in session.exception)
+
+    for i in range(min(args.moves, len(session.slider))):
+        slider = session.slider[i]
+        if isinstance(slider.value, (int, float)):
+            target = slider.max if slider.value != slider.max else slider.min
+            rerun(f"slider:{slider.label}", slider.set_value(target))
+
+    # Older testing APIs have no st.file_uploader support, so uploads are skipped there
+    with open(os.path.join(REPO_DIR, SUITE_UPLOAD_FILE), "rb") as f:
+        upload_content = f.read()
+    for i in range(len(getattr(session, "file_uploader", []))):
+        uploader = session.file_uploader[i]
+        if not uploader.allowed_type or any(t.lstrip(".") == "csv" for t in uploader.allowed_type):
+            rerun(f"upload:{uploader.label}", uploader.set_value((SUITE_UPLOAD_FILE, upload_content, "text/csv")))
+
+    labels = [button.label for button in session.button if any(word in button.label for word in SUITE_BUTTON_WORDS)]
+    for label in labels:
+        matches = [button for button in session.button if button.label == label]
+        if matches:
+            rerun(f"button:{label}", matches[0].click())
+
+    print(json.dumps({
+        "cold_start_ms": cold_start * 1000,
+        "reruns_ms": [elapsed * 1000 for elapsed in reruns],
+        "interactions": interactions,
+        "exceptions": exceptions,
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }))
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def bench_suite(args):
+    """Cold start, rerun latency and peak memory for every app, written as a JSON report"""
+    import json
+    import platform
+    import py_compile
+    import subprocess
+    import sys
+    import tempfile
+
+    apps = args.apps or streamlit_apps()
+    commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=REPO_DIR).stdout.strip()
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "notes": "Download buttons are not replayed; uploads need a testing API with st.file_uploader support",
+        "apps": {}
+    }
+
+    rows = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = isolated_app_env(data_dir)
+        for app in apps:
+            try:
+                py_compile.compile(os.path.join(REPO_DIR, app), cfile=os.path.join(data_dir, "compiled.pyc"), doraise=True)
+            except py_compile.PyCompileError as e:
+                report["apps"][app] = {"status": "syntax error", "error": e.msg}
+                rows.append([app, "syntax error", "-", "-", "-", "-"])
+                continue
+
+            command = [
+                sys.executable, os.path.abspath(__file__), "suite-child",
+                "--app", app, "--moves", str(args.moves), "--timeout", str(args.timeout)
+            ]
+            completed = subprocess.run(command, capture_output=True, text=True, cwd=data_dir, env=env)
+            if completed.returncode != 0:
+                report["apps"][app] = {"status": "failed", "error": completed.stderr.strip().splitlines()[-1:]}
+                rows.append([app, "failed", "-", "-", "-", "-"])
+                continue
+
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            reruns = result["reruns_ms"]
+            result["status"] = "error" if result["exceptions"] else "ok"
+            result["rerun_p50_ms"] = percentile(reruns, 0.5) if reruns else None
+            result["rerun_p95_ms"] = percentile(reruns, 0.95) if reruns else None
+            report["apps"][app] = result
+            rows.append([
+                app,
+                result["status"],
+                f"{result['cold_start_ms']:,.0f}",
+                f"{result['rerun_p50_ms']:,.0f}" if reruns else "-",
+                f"{result['rerun_p95_ms']:,.0f}" if reruns else "-",
+                f"{result['peak_rss_mib']:,.0f}"
+            ])
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"App suite report written to {args.output}")
+    print_table(["App", "Status", "Cold start (ms)", "Rerun p50 (ms)", "Rerun p95 (ms)", "Peak RSS (MiB)"], rows)
+
+# One completed department in the doge-appv5-1.py detail tab: (widget type, label, value)
+DEPARTMENT_ENTRY = [
+    ("text_input", "Department Name", "Department of Transportation"),
+    ("text_area", "Description of the Department", "Plans and maintains the transportation network."),
+    ("number_input", "Number of Employees", 1200),
+    ("text_area", "Current Areas of Governance", "Highways, transit grants."),
+    ("text_area", "Suggested Areas of Governance", "Rail modernization."),
+    ("number_input", "Annual Budget (in Million USD)", 850.0),
+    ("slider", "Budget Utilization (%)", 82),
+    ("slider", "Regulatory Oversight Level", 40),
+    ("slider", "Economic Oversight Level", 35),
+    ("select_slider", "Communication", 4),
+    ("select_slider", "Transparency", 3),
+    ("select_slider", "Responsiveness", 5),
+    ("select_slider", "Policy Impact", 4),
+    ("select_slider", "Citizen Satisfaction", 2)
+]
+
+def bench_batch_entry(args):
+    """Script runs and CPU to enter one department, per widget against batch entry"""
+    from streamlit.testing.v1 import AppTest
+
+    def widget(session, widget_type, label):
+        return next(w for w in getattr(session, widget_type) if w.label == label)
+
+    rows = []
+    for mode in ("Per widget", "Batch entry"):
+        totals = [0, 0.0, 0.0]
+        for _ in range(args.repeat):
+            session = AppTest.from_file(os.path.join(REPO_DIR, "doge-appv5-1.py"), default_timeout=args.timeout)
+            session.run()
+            if mode == "Batch entry":
+                widget(session, "checkbox", "Batch entry").check().run()
+
+            def run(action):
+                # The script runs on its own thread, so CPU is taken for the whole process
+                cpu, start = time.process_time(), time.perf_counter()
+                action.run()
+                totals[0] += 1
+                totals[1] += time.process_time() - cpu
+                totals[2] += time.perf_counter() - start
+
+            for widget_type, label, value in DEPARTMENT_ENTRY:
+                action = widget(session, widget_type, label).set_value(value)
+                if mode == "Per widget":
+                    run(action)
+            if mode == "Batch entry":
+                run(widget(session, "button", "Apply Inputs").click())
+            if session.exception:
+                raise SystemExit(f"doge-appv5-1.py raised: {session.exception[0].message}")
+        rows.append([
+            mode,
+            f"{totals[0] / args.repeat:,.0f}",
+            f"{totals[1] / args.repeat * 1000:,.1f}",
+            f"{totals[2] / args.repeat * 1000:,.0f}"
+        ])
+
+    print(f"Entering one department ({len(DEPARTMENT_ENTRY)} inputs) in doge-appv5-1.py, mean of {args.repeat}")
+    print_table(["Mode", "Script runs", "CPU (ms)", "Wall time (ms)"], rows)
+
+# Streamlit's testing API only does full-script reruns. Fragment-only reruns are driven
+# through its private script runner and fragment storage, which were checked against these
+# releases (major, minor); on any other release only the full-rerun columns are measured
+FRAGMENT_RERUN_STREAMLIT = {(1, 65)}
+
+def streamlit_release():
+    from importlib.metadata import version
+    return tuple(int(part) for part in version("streamlit").split(".")[:2])
+
+def bench_interactions(args):
+    """Latency of moving one assessment slider as a full-script rerun and as a fragment-only rerun"""
+    import functools
+    import statistics
+    from unittest import mock
+    from streamlit.testing.v1 import AppTest
+
+    fragment_reruns = streamlit_release() in FRAGMENT_RERUN_STREAMLIT
+    if fragment_reruns:
+        import streamlit.testing.v1.local_script_runner as local_script_runner
+        from streamlit.runtime.scriptrunner_utils.script_requests import RerunData
+
+    def fragment_scoped(fragment_id):
+        # AppTest always asks for a full rerun; the browser sends the id of the fragment that owns the widget
+        return mock.patch.object(
+            local_script_runner, "RerunData",
+            functools.partial(RerunData, fragment_id_queue=[fragment_id], is_fragment_scoped_rerun=True)
+        )
+
+    def slider_fragment(session):
+        """Id of the fragment whose scoped rerun renders the slider, or None"""
+        for fragment_id in list(session._fragment_storage._fragments):
+            with fragment_scoped(fragment_id):
+                session.slider(key=args.slider).set_value(0).run()
+            owns_slider = any(slider.key == args.slider for slider in session.slider)
+            # A full run restores the elements outside the fragment
+            session.run()
+            if owns_slider:
+                return fragment_id
+        return None
+
+    def move_slider(session, scope):
+        timings = []
+        for i in range(args.moves):
+            slider = session.slider(key=args.slider)
+            with scope():
+                start = time.perf_counter()
+                slider.set_value(i % 26).run()
+                timings.append(time.perf_counter() - start)
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        return [f"{statistics.median(timings) * 1000:,.1f}", f"{p95 * 1000:,.1f}"]
+
+    rows = []
+    for app in args.apps:
+        session = AppTest.from_file(os.path.join(REPO_DIR, app), default_timeout=args.timeout)
+        start = time.perf_counter()
+        session.run()
+        first_run = time.perf_counter() - start
+
+        row = [app, f"{first_run * 1000:,.1f}"] + move_slider(session, contextlib.nullcontext)
+        if not fragment_reruns:
+            release = ".".join(map(str, streamlit_release()))
+            rows.append(row + ["-", "-", f"fragment reruns not checked on Streamlit {release}"])
+            continue
+        fragment_id = slider_fragment(session)
+        if fragment_id is None:
+            row += ["-", "-", "slider is not in a fragment"]
+        else:
+            row += move_slider(session, lambda: fragment_scoped(fragment_id)) + [""]
+        rows.append(row)
+
+    print(f"Slider interaction latency over {args.moves} moves of {args.slider!r}")
+    print_table(
+        ["App", "First run (ms)", "Full rerun p50 (ms)", "Full rerun p95 (ms)", "Fragment rerun p50 (ms)", "Fragment rerun p95 (ms)", "Notes"],
+        rows
+    )
+
+def bench_charts(args):
+    """Per-rerun chart build time with cold caches, new scores and repeated scores"""
+    app = load_app("doge-appv4.py")
+    rng = random.Random(args.seed)
+
+    def score_vector():
+        metric_values = tuple(
+            (category, tuple(rng.randint(0, 25) for _ in metrics))
+            for category, metrics in app.EFFICIENCY_CATEGORIES.items()
+        )
+        category_values = tuple(sum(values) / len(values) * 4 for _, values in metric_values)
+        return category_values, metric_values
+
+    def cold():
+        app.get_chart_templates.clear()
+        app.build_charts.clear()
+        return app.build_charts(*score_vector())
+
+    repeated = score_vector()
+    cases = {
+        "Cold (templates and figures built)": cold,
+        "New scores (template copied)": lambda: app.build_charts(*score_vector()),
+        "Repeated scores (cached figure)": lambda: app.build_charts(*repeated)
+    }
+    rows = []
+    for name, build in cases.items():
+        elapsed, _ = time_call(build, repeat=args.repeat)
+        rows.append([name, f"{elapsed * 1000:,.2f}"])
+
+    print("doge-appv4.py radar and bar chart build time")
+    print_table(["Case", "Time (ms)"], rows)
+
+def scoring_request(rng, kind):
+    """One random request body for a scoring-api.py route"""
+    if kind == "categories":
+        return {"categories": {
+            category: {metric: rng.randint(0, 25) for metric in metrics}
+            for category, metrics in EFFICIENCY_CATEGORIES.items()
+        }}
+    request = {field: rng.randint(1, 5) for field in ["communication", "transparency", "responsiveness", "policy_impact", "citizen_satisfaction"]}
+    if kind == "efficiency":
+        request.update(
+            employees=rng.randint(1, 100000), budget=round(rng.uniform(1, 5000), 2), utilization=rng.randint(0, 100),
+            oversight=rng.randint(0, 100), num_regulations=rng.randint(0, 60), economic_oversight=rng.randint(0, 100)
+        )
+    return request
+
+def scoring_client(port, args, client, deadline, results, batches=False):
+    """Keep one connection busy until the deadline with single scores, or with heavy batches polled to completion"""
+    import http.client
+    import json
+
+    rng = random.Random(args.seed + client)
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    # The batch body is encoded once, so the client spends its time waiting on the server
+    batch_body = json.dumps({"items": [scoring_request(rng, "efficiency") for _ in range(args.batch_size)]}).encode("utf-8") if batches else None
+
+    def call(method, path, body=None):
+        started = time.perf_counter()
+        if body is not None and not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        connection.request(method, path, body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+        finished = time.perf_counter()
+        return response.status, payload, started, finished
+
+    while time.perf_counter() < deadline:
+        if batches:
+            status, payload, started, _ = call("POST", "/batch/efficiency", batch_body)
+            status_url = payload.get("status_url")
+            while status == 202 or payload.get("status") == "pending":
+                time.sleep(0.05)
+                status, payload, _, _ = call("GET", status_url)
+            ok = status == 200 and len(payload.get("results", [])) == args.batch_size
+            results.append(("batch job", started, time.perf_counter(), ok))
+            continue
+        kind = rng.choice(["efficiency", "effectiveness", "categories"])
+        status, payload, started, finished = call("POST", f"/score/{kind}", scoring_request(rng, kind))
+        results.append((kind, started, finished, status == 200 and "error" not in payload))
+    connection.close()
+
+def bench_scoring_api(args):
+    """Sustained throughput and latency of scoring-api.py under concurrent localhost clients"""
+    import json
+    import subprocess
+    import sys
+    import threading
+    import urllib.request
+
+    command = [sys.executable, os.path.join(REPO_DIR, "scoring-api.py"), "--port", "0", "--workers", str(args.workers)]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    try:
+        banner = server.stdout.readline()
+        port = int(banner.split("http://")[1].split()[0].rsplit(":", 1)[1])
+
+        results = []
+        start = time.perf_counter()
+        deadline = start + args.duration
+        clients = [
+            threading.Thread(target=scoring_client, args=(port, args, client, deadline, results, client >= args.clients))
+            for client in range(args.clients + args.batch_clients)
+        ]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/stats") as response:
+            server_stats = json.loads(response.read())
+    finally:
+        server.terminate()
+        server.wait()
+
+    rows = []
+    for kind in sorted({result[0] for result in results}):
+        latencies = [finished - started for name, started, finished, _ in results if name == kind]
+        errors = sum(1 for name, _, _, ok in results if name == kind and not ok)
+        rows.append([
+            kind,
+            f"{len(latencies):,}",
+            f"{len(latencies) / elapsed:,.0f}",
+            f"{percentile(latencies, 0.50) * 1000:,.2f}",
+            f"{percentile(latencies, 0.95) * 1000:,.2f}",
+            f"{percentile(latencies, 0.99) * 1000:,.2f}",
+            errors
+        ])
+
+    # Single scores completed in each whole second of the run, to show the rate holds while batch jobs run
+    per_second = [0] * max(1, int(args.duration))
+    for name, _, finished, _ in results:
+        second = int(finished - start)
+        if name == "batch job":
+            continue
+        if second < len(per_second):
+            per_second[second] += 1
+
+    print(f"scoring-api.py with {args.workers} workers, {args.clients} single and {args.batch_clients} batch clients for {elapsed:.1f} s")
+    print_table(["Request", "Count", "Per second", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Errors"], rows)
+    print(f"Single scores per second: min {min(per_second):,}, median {sorted(per_second)[len(per_second) // 2]:,}, max {max(per_second):,}")
+    print()
+    print("Server-side latency from /stats")
+    print_table(
+        ["Route", "Count", "p50 (ms)", "p95 (ms)", "p99 (ms)"],
+        [
+            [route, f"{stats['count']:,}", f"{stats['p50_ms']:,.2f}", f"{stats['p95_ms']:,.2f}", f"{stats['p99_ms']:,.2f}"]
+            for route, stats in sorted(server_stats["routes"].items())
+        ]
+    )
+
+# Synthetic dataset columns passed to the scoring-api.py efficiency scorer
+SCORING_FIELDS = {
+    "Employees": "employees",
+    "Budget (Million USD)": "budget",
+    "Budget Utilization (%)": "utilization",
+    "Regulatory Oversight (%)": "oversight",
+    "Regulations": "num_regulations",
+    "Economic Oversight (%)": "economic_oversight",
+    "Communication": "communication",
+    "Transparency": "transparency",
+    "Responsiveness": "responsiveness",
+    "Policy Impact": "policy_impact",
+    "Citizen Satisfaction": "citizen_satisfaction"
+}
+
+def bench_synthetic(args):
+    """Write a synthetic agency table in every format, then time the apps' loaders and the scorer on it"""
+    import json
+    import tempfile
+    import xml.etree.ElementTree as ET
+    import pandas as pd
+
+    generator = load_app("synthetic-agency-data.py")
+    scoring = load_app("scoring-api.py")
+
+    def load_xml(path):
+        root = ET.parse(path).getroot()
+        return pd.DataFrame([{child.tag: child.text for child in element} for element in root])
+
+    def load_json(path):
+        with open(path) as f:
+            return pd.DataFrame(json.load(f))
+
+    # The same parsing the upload handlers in the apps use for each format
+    loaders = {"csv": pd.read_csv, "json": load_json, "xml": load_xml, "parquet": pd.read_parquet}
+    rows = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        for file_format in args.formats:
+            path = os.path.join(data_dir, f"agencies.{file_format}")
+            write_time, _ = time_call(lambda: generator.write_dataset(path, args.rows, args.seed, file_format), repeat=1)
+            load_time, frame = time_call(lambda: loaders[file_format](path), repeat=1)
+            rows.append([
+                file_format,
+                f"{os.path.getsize(path) / 1024 / 1024:,.1f}",
+                f"{write_time:,.2f}",
+                f"{args.rows / write_time:,.0f}",
+                f"{load_time:,.2f}",
+                f"{len(frame):,}"
+            ])
+            if file_format == "csv":
+                records = frame[list(SCORING_FIELDS)].rename(columns=SCORING_FIELDS).to_dict("records")
+
+    print(f"Synthetic agency table, {args.rows:,} rows (seed {args.seed})")
+    print_table(["Format", "Size (MiB)", "Write (s)", "Rows/s", "Load (s)", "Rows loaded"], rows)
+    if "csv" in args.formats:
+        score_time, results = time_call(lambda: scoring.score_items("efficiency", records), repeat=1)
+        errors = sum(1 for result in results if "error" in result)
+        print(f"Efficiency scores for every row: {score_time:,.2f} s ({len(results) / score_time:,.0f} rows/s, {errors} errors)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Performance benchmarks for the efficiency apps")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    exports = subparsers.add_parser("exports", help="Compare export format size and speed")
+    exports.add_argument("--records", type=int, default=10000)
+    exports.add_argument("--repeat", type=int, default=3)
+    exports.add_argument("--seed", type=int, default=42)
+    exports.set_defaults(func=bench_exports)
+
+    snapshot = subparsers.add_parser("snapshot", help="Compare binary session snapshots with JSON exports")
+    snapshot.add_argument("--assessments", type=int, default=100000)
+    snapshot.add_argument("--repeat", type=int, default=3)
+    snapshot.add_argument("--seed", type=int, default=42)
+    snapshot.set_defaults(func=bench_snapshot)
+
+    tasks = subparsers.add_parser("tasks", help="Time EfficiencyTracker task lookups and deletes")
+    tasks.add_argument("--tasks", type=int, default=10000)
+    tasks.add_argument("--deletes", type=int, default=1000)
+    tasks.add_argument("--repeat", type=int, default=3)
+    tasks.set_defaults(func=bench_tasks)
+
+    stress = subparsers.add_parser("tasks-stress", help="Concurrent writers on the EfficiencyTracker journal store")
+    stress.add_argument("--writers", type=int, default=50)
+    stress.add_argument("--operations", type=int, default=200)
+    stress.add_argument("--compact-kib", type=int, default=256)
+    stress.set_defaults(func=bench_tasks_stress)
+
+    sessions = subparsers.add_parser("sessions", help="Report RSS as the number of app sessions grows")
+    sessions.add_argument("--app", default="doge-appv7.py")
+    sessions.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50, 200])
+    sessions.add_argument("--timeout", type=float, default=30)
+    sessions.set_defaults(func=bench_sessions)
+
+    charts = subparsers.add_parser("charts", help="Time the cached radar and bar chart builder")
+    charts.add_argument("--repeat", type=int, default=20)
+    charts.add_argument("--seed", type=int, default=42)
+    charts.set_defaults(func=bench_charts)
+
+    downsample = subparsers.add_parser("downsample", help="Compare raw and LTTB-downsampled history charts")
+    downsample.add_argument("--points", type=int, default=100000)
+    downsample.add_argument("--repeat", type=int, default=3)
+    downsample.add_argument("--seed", type=int, default=42)
+    downsample.set_defaults(func=bench_downsample)
+
+    startup = subparsers.add_parser("startup", help="Compare cold start with eager and lazy imports")
+    startup.add_argument("--apps", nargs="*")
+    startup.add_argument("--repeat", type=int, default=3)
+    startup.add_argument("--timeout", type=float, default=60)
+    startup.set_defaults(func=bench_startup)
+
+    child = subparsers.add_parser("startup-child")
+    child.add_argument("--app", required=True)
+    child.add_argument("--eager", action="store_true")
+    child.add_argument("--timeout", type=float, default=60)
+    child.set_defaults(func=startup_child)
+
+    suite = subparsers.add_parser("suite", help="Drive every app and write a JSON latency and memory report")
+    suite.add_argument("--apps", nargs="*")
+    suite.add_argument("--moves", type=int, default=20)
+    suite.add_argument("--timeout", type=float, default=60)
+    suite.add_argument("--output", default="benchmark-report.json")
+    suite.set_defaults(func=bench_suite)
+
+    suite_run = subparsers.add_parser("suite-child")
+    suite_run.add_argument("--app", required=True)
+    suite_run.add_argument("--moves", type=int, default=20)
+    suite_run.add_argument("--timeout", type=float, default=60)
+    suite_run.set_defaults(func=suite_child)
+
+    batch = subparsers.add_parser("batch-entry", help="Compare per-widget and batch entry of one department")
+    batch.add_argument("--repeat", type=int, default=5)
+    batch.add_argument("--timeout", type=float, default=30)
+    batch.set_defaults(func=bench_batch_entry)
+
+    interactions = subparsers.add_parser("interactions", help="Time slider moves on the assessment apps")
+    interactions.add_argument("--apps", nargs="+", default=["doge-appv4.py", "doge-appv5-1.py"])
+    interactions.add_argument("--slider", default="Operational Efficiency_Process Optimization")
+    interactions.add_argument("--moves", type=int, default=50)
+    interactions.add_argument("--timeout", type=float, default=30)
+    interactions.set_defaults(func=bench_interactions)
+
+    scoring = subparsers.add_parser("scoring-api", help="Load test scoring-api.py over localhost")
+    scoring.add_argument("--duration", type=float, default=10)
+    scoring.add_argument("--clients", type=int, default=8)
+    scoring.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    scoring.add_argument("--batch-clients", type=int, default=1)
+    scoring.add_argument("--batch-size", type=int, default=20000)
+    scoring.add_argument("--seed", type=int, default=42)
+    scoring.set_defaults(func=bench_scoring_api)
+
+    synthetic = subparsers.add_parser("synthetic", help="Time the loaders and scorer on a generated agency table")
+    synthetic.add_argument("--rows", type=int, default=100000)
+    synthetic.add_argument("--formats", nargs="+", choices=["csv", "json", "xml", "parquet"], default=["csv", "json", "xml", "parquet"])
+    synthetic.add_argument("--seed", type=int, default=42)
+    synthetic.set_defaults(func=bench_synthetic)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,430 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads within one process are serialized
+    fcntl = None
+
+class TaskCounters:
+    """Running task totals and per-day buckets, updated in O(1) for every change"""
+
+    WINDOWS = {'day': 1, 'week': 7, 'month': 30}
+
+    def __init__(self, total=0, completed=0, created_by_day=None, completed_by_day=None):
+        self.total = total
+        self.completed = completed
+        self.created_by_day = created_by_day or {}
+        self.completed_by_day = completed_by_day or {}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def to_dict(self):
+        return {
+            'total': self.total,
+            'completed': self.completed,
+            'created_by_day': self.created_by_day,
+            'completed_by_day': self.completed_by_day
+        }
+
+    @staticmethod
+    def _bump(buckets, timestamp, amount):
+        if not timestamp:
+            return
+        day = timestamp[:10]
+        buckets[day] = buckets.get(day, 0) + amount
+        if buckets[day] == 0:
+            del buckets[day]
+
+    def add(self, task):
+        self.total += 1
+        self._bump(self.created_by_day, task.get('created_at'), 1)
+        if task['completed']:
+            self.completed += 1
+            self._bump(self.completed_by_day, task.get('completed_at'), 1)
+
+    def remove(self, task):
+        self.total -= 1
+        self._bump(self.created_by_day, task.get('created_at'), -1)
+        if task['completed']:
+            self.completed -= 1
+            self._bump(self.completed_by_day, task.get('completed_at'), -1)
+
+    def window_rates(self, today=None):
+        """Completions over creations for each rolling window, read from at most 30 day buckets"""
+        today = today or datetime.now().date()
+        rates = {}
+        for name, days in self.WINDOWS.items():
+            window = [(today - timedelta(days=offset)).isoformat() for offset in range(days)]
+            created = sum(self.created_by_day.get(day, 0) for day in window)
+            completed = sum(self.completed_by_day.get(day, 0) for day in window)
+            rates[name] = round(min(completed / created * 100, 100), 2) if created else 0
+        return rates
+
+def apply_task_entry(tasks, counters, entry):
+    """Apply one journal entry to an id -> task dict and its counters"""
+    # Entries are idempotent so replaying a journal that was already compacted is harmless
+    if entry['op'] == 'add':
+        previous = tasks.get(entry['task']['id'])
+        if previous is not None:
+            counters.remove(previous)
+        tasks[entry['task']['id']] = entry['task']
+        counters.add(entry['task'])
+    elif entry['op'] == 'update' and entry['id'] in tasks:
+        task = tasks[entry['id']]
+        counters.remove(task)
+        task.update(entry['fields'])
+        counters.add(task)
+    elif entry['op'] == 'delete' and entry['id'] in tasks:
+        counters.remove(tasks.pop(entry['id']))
+
+class JournalTaskStore:
+    """Task persistence as a JSON snapshot plus an append-only journal of changes
+
+    Writers from any session or process take an exclusive file lock. The store version
+    is (journal generation, journal length), and an entry is only appended by a writer
+    whose version is current. A stale writer gets back the entries appended since, or
+    None when a compaction means it must reload, and retries once it has caught up.
+    """
+
+    def __init__(self, snapshot_path='tasks.json', journal_path='tasks.journal', compact_bytes=1024 * 1024):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.lock_path = snapshot_path + '.lock'
+        self.compact_bytes = compact_bytes
+        self.thread_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        with self.thread_lock, open(self.lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _version(self):
+        """Journal generation from its header line, and its current length"""
+        try:
+            with open(self.journal_path, 'rb') as f:
+                header = f.readline()
+                f.seek(0, os.SEEK_END)
+                length = f.tell()
+        except FileNotFoundError:
+            return (0, 0)
+        try:
+            entry = json.loads(header)
+        except ValueError:
+            return (0, length)
+        return (entry.get('generation', 0) if entry.get('op') == 'generation' else 0, length)
+
+    def _read_journal(self, start=0):
+        """Journal entries from a byte offset, dropping a partial last line left by a crash"""
+        entries = []
+        try:
+            with open(self.journal_path, 'rb+') as f:
+                f.seek(start)
+                valid_length = start
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        f.truncate(valid_length)
+                        break
+                    entries.append(entry)
+                    valid_length += len(line)
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _read(self):
+        tasks = {}
+        counters = None
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+            # Snapshots written before counters were persisted are a bare task list
+            if isinstance(snapshot, list):
+                snapshot = {'tasks': snapshot}
+            tasks = {task['id']: task for task in snapshot['tasks']}
+            if 'counters' in snapshot:
+                counters = TaskCounters.from_dict(snapshot['counters'])
+        except FileNotFoundError:
+            pass
+        if counters is None:
+            counters = TaskCounters()
+            for task in tasks.values():
+                counters.add(task)
+
+        for entry in self._read_journal():
+            apply_task_entry(tasks, counters, entry)
+        return tasks, counters
+
+    def load(self):
+        """Read the snapshot and replay the journal on top of it; returns tasks, counters and version"""
+        with self._locked():
+            tasks, counters = self._read()
+            return list(tasks.values()), counters, self._version()
+
+    def _entries_between(self, version, current):
+        if version is None or current[0] != version[0]:
+            return None
+        return self._read_journal(version[1]) if current[1] != version[1] else []
+
+    def entries_since(self, version):
+        """Current version and the entries appended since `version`, or None when a compaction means a reload"""
+        with self._locked():
+            current = self._version()
+            return current, self._entries_between(version, current)
+
+    def record(self, entry, version):
+        """Append one entry if `version` is current; returns whether it was written, the
+        version and the entries other writers added since `version` (None: reload)"""
+        with self._locked():
+            current = self._version()
+            missed = self._entries_between(version, current)
+            if missed is None or missed:
+                return False, current, missed
+            with open(self.journal_path, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            return True, self._version(), []
+
+    def changed_since(self, version):
+        """Sessions catch up with other writers through the entries `record` returns"""
+        return False
+
+    def needs_compaction(self):
+        try:
+            return os.path.getsize(self.journal_path) >= self.compact_bytes
+        except FileNotFoundError:
+            return False
+
+    def _write_atomic(self, path, text):
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def compact(self):
+        """Fold the journal into a fresh snapshot, then start the next journal generation
+
+        The snapshot is rebuilt from disk under the lock, so changes made by other
+        sessions are never overwritten by this session's copy of the tasks.
+        """
+        with self._locked():
+            if not self.needs_compaction():
+                return
+            generation = self._version()[0]
+            tasks, counters = self._read()
+            self._write_atomic(self.snapshot_path, json.dumps({
+                'tasks': list(tasks.values()),
+                'counters': counters.to_dict()
+            }))
+            self._write_atomic(self.journal_path, json.dumps({'op': 'generation', 'generation': generation + 1}) + '\n')
+
+class SQLiteTaskStore:
+    """Task persistence in an indexed SQLite table, shared safely between sessions
+
+    Every write bumps a version row in the same transaction. Sessions compare it with
+    the version they loaded and reload when another session or process has written.
+    Metrics always come from aggregate queries, so they include every writer's changes.
+    """
+
+    CREATE_SQL = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id REAL PRIMARY KEY,
+            text TEXT NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            completed_at TEXT
+        )
+    """
+    INDEX_SQL = [
+        "CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_completed_at ON tasks (completed_at)"
+    ]
+    SELECT_SQL = "SELECT id, text, completed, created_at, completed_at FROM tasks ORDER BY created_at, id"
+    INSERT_SQL = "INSERT OR REPLACE INTO tasks (id, text, completed, created_at, completed_at) VALUES (?, ?, ?, ?, ?)"
+    UPDATE_TEXT_SQL = "UPDATE tasks SET text = ? WHERE id = ?"
+    UPDATE_COMPLETED_SQL = "UPDATE tasks SET completed = ?, completed_at = ? WHERE id = ?"
+    DELETE_SQL = "DELETE FROM tasks WHERE id = ?"
+    CREATE_VERSION_SQL = "CREATE TABLE IF NOT EXISTS task_store_version (version INTEGER NOT NULL)"
+    VERSION_SQL = "SELECT version FROM task_store_version"
+    BUMP_VERSION_SQL = "UPDATE task_store_version SET version = version + 1"
+    METRICS_SQL = "SELECT COUNT(*), COALESCE(SUM(completed), 0) FROM tasks"
+    # Only the days inside the longest rolling window are bucketed; both use the date indexes
+    CREATED_BY_DAY_SQL = "SELECT substr(created_at, 1, 10), COUNT(*) FROM tasks WHERE created_at >= ? GROUP BY 1"
+    COMPLETED_BY_DAY_SQL = (
+        "SELECT substr(completed_at, 1, 10), COUNT(*) FROM tasks "
+        "WHERE completed = 1 AND completed_at >= ? GROUP BY 1"
+    )
+
+    def __init__(self, db_path='tasks.db'):
+        self.db_path = db_path
+        # One connection shared by every session; the lock serializes writers
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(self.CREATE_SQL)
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(tasks)")]
+            if 'completed_at' not in columns:
+                self.connection.execute("ALTER TABLE tasks ADD COLUMN completed_at TEXT")
+            for index_sql in self.INDEX_SQL:
+                self.connection.execute(index_sql)
+            self.connection.execute(self.CREATE_VERSION_SQL)
+            if self.connection.execute(self.VERSION_SQL).fetchone() is None:
+                self.connection.execute("INSERT INTO task_store_version (version) VALUES (0)")
+        # Rows and counters as of a store version, shared by every session in this process
+        self.cached_rows = None
+        self.cached_counters = None
+
+    def _version(self):
+        return self.connection.execute(self.VERSION_SQL).fetchone()[0]
+
+    def changed_since(self, version):
+        """Whether any session or process has written since `version`"""
+        with self.lock:
+            return self._version() != version
+
+    def counters(self, today=None):
+        """Totals and the day buckets of the rolling windows, from aggregate queries"""
+        today = today or datetime.now().date()
+        since = (today - timedelta(days=max(TaskCounters.WINDOWS.values()) - 1)).isoformat()
+        with self.lock:
+            version = self._version()
+            if self.cached_counters is None or self.cached_counters[0] != (version, since):
+                total, completed = self.connection.execute(self.METRICS_SQL).fetchone()
+                created_by_day = dict(self.connection.execute(self.CREATED_BY_DAY_SQL, (since,)).fetchall())
+                completed_by_day = dict(self.connection.execute(self.COMPLETED_BY_DAY_SQL, (since,)).fetchall())
+                self.cached_counters = ((version, since), (total, completed, created_by_day, completed_by_day))
+            total, completed, created_by_day, completed_by_day = self.cached_counters[1]
+        return TaskCounters(total, completed, dict(created_by_day), dict(completed_by_day))
+
+    def load(self):
+        """Every task as of the current version; sessions opened between writes share one query"""
+        with self.lock:
+            version = self._version()
+            if self.cached_rows is None or self.cached_rows[0] != version:
+                self.cached_rows = (version, self.connection.execute(self.SELECT_SQL).fetchall())
+            rows = self.cached_rows[1]
+        tasks = [
+            {'id': task_id, 'text': text, 'completed': bool(completed_flag), 'created_at': created_at, 'completed_at': completed_at}
+            for task_id, text, completed_flag, created_at, completed_at in rows
+        ]
+        return tasks, self.counters(), version
+
+    def record(self, entry, version):
+        """Apply one change in its own transaction; the change is always written, and the
+        missed entries are None when another writer got in first so the session must reload"""
+        with self.lock, self.connection:
+            # Bumping first takes the write lock, so the version read next is this write's
+            self.connection.execute(self.BUMP_VERSION_SQL)
+            current = self._version()
+            if entry['op'] == 'add':
+                task = entry['task']
+                self.connection.execute(self.INSERT_SQL, (
+                    task['id'], task['text'], int(task['completed']), task['created_at'], task.get('completed_at')
+                ))
+            elif entry['op'] == 'update':
+                fields = entry['fields']
+                if 'text' in fields:
+                    self.connection.execute(self.UPDATE_TEXT_SQL, (fields['text'], entry['id']))
+                if 'completed' in fields:
+                    self.connection.execute(self.UPDATE_COMPLETED_SQL, (int(fields['completed']), fields.get('completed_at'), entry['id']))
+            elif entry['op'] == 'delete':
+                self.connection.execute(self.DELETE_SQL, (entry['id'],))
+        missed = [] if version is not None and current == version + 1 else None
+        return True, current, missed
+
+    def needs_compaction(self):
+        return False
+
+    def compact(self):
+        pass
+
+@st.cache_resource
+def get_task_store():
+    """Pick the task backend from TASK_STORE_BACKEND ('json' or 'sqlite')"""
+    if os.environ.get('TASK_STORE_BACKEND', 'json') == 'sqlite':
+        return SQLiteTaskStore(os.environ.get('TASK_STORE_PATH', 'tasks.db'))
+    return JournalTaskStore()
+
+# Catch-up and retry rounds before a save gives up while other sessions keep writing
+RECORD_ATTEMPTS = 10
 
 class EfficiencyTracker:
-    def __init__(self):
-        # Initialize session state for tasks if not exists
-        if 'tasks' not in st.session_state:
-            st.session_state.tasks = []
+    def __init__(self, store=None):
+        self.store = store or get_task_store()
+        # Load tasks on the first run, and again once another session has written to the store
+        if 'tasks' not in st.session_state or self.store.changed_since(st.session_state.task_version):
+            self._load_tasks()
 
     def _save_tasks(self):
-        """Save tasks to file or browser storage equivalent"""
+        """Compact the journal into a new snapshot once it grows large"""
         try:
-            with open('tasks.json', 'w') as f:
-                json.dump(st.session_state.tasks, f)
+            if self.store.needs_compaction():
+                self.store.compact()
         except Exception as e:
             st.error(f"Error saving tasks: {e}")
 
     def _load_tasks(self):
-        """Load tasks from file or browser storage equivalent"""
+        """Load tasks and their running counters from the store"""
         try:
-            with open('tasks.json', 'r') as f:
-                st.session_state.tasks = json.load(f)
-        except FileNotFoundError:
-            st.session_state.tasks = []
+            tasks, st.session_state.task_counters, st.session_state.task_version = self.store.load()
+            # Tasks are indexed by id; dict order keeps the display order
+            st.session_state.tasks = {task['id']: task for task in tasks}
         except Exception as e:
+            st.session_state.tasks = {}
+            st.session_state.task_counters = TaskCounters()
+            st.session_state.task_version = None
             st.error(f"Error loading tasks: {e}")
 
+    def _record(self, entry):
+        """Persist one change, then apply it after the changes other sessions saved first,
+        so the session's tasks follow the same order as the store"""
+        for _ in range(RECORD_ATTEMPTS):
+            try:
+                written, version, missed = self.store.record(entry, st.session_state.task_version)
+            except Exception as e:
+                st.error(f"Error saving tasks: {e}")
+                return
+            if missed is None:
+                # A reload after a successful write already contains the change
+                self._load_tasks()
+            else:
+                for missed_entry in missed:
+                    apply_task_entry(st.session_state.tasks, st.session_state.task_counters, missed_entry)
+                if written:
+                    apply_task_entry(st.session_state.tasks, st.session_state.task_counters, entry)
+                st.session_state.task_version = version
+            if written:
+                self._save_tasks()
+                return
+        st.error("Error saving tasks: the task list kept changing, please try again")
+
     def add_task(self, task_text):
         """Add a new task to the list"""
         if task_text.strip():
@@ -34,44 +432,42 @@ class EfficiencyTracker:
                 'id': datetime.now().timestamp(),
                 'text': task_text,
                 'completed': False,
-                'created_at': datetime.now().isoformat()
+                'created_at': datetime.now().isoformat(),
+                'completed_at': None
             }
-            st.session_state.tasks.append(new_task)
-            self._save_tasks()
+            self._record({'op': 'add', 'task': new_task})
 
     def delete_task(self, task_id):
         """Delete a task by its ID"""
-        st.session_state.tasks = [
-            task for task in st.session_state.tasks 
-            if task['id'] != task_id
-        ]
-        self._save_tasks()
+        if task_id in st.session_state.tasks:
+            self._record({'op': 'delete', 'id': task_id})
 
     def toggle_task_completion(self, task_id):
         """Toggle task completion status"""
-        for task in st.session_state.tasks:
-            if task['id'] == task_id:
-                task['completed'] = not task['completed']
-        self._save_tasks()
+        task = st.session_state.tasks.get(task_id)
+        if task is not None:
+            completed = not task['completed']
+            completed_at = datetime.now().isoformat() if completed else None
+            self._record({'op': 'update', 'id': task_id, 'fields': {'completed': completed, 'completed_at': completed_at}})
 
     def edit_task(self, task_id, new_text):
         """Edit an existing task"""
-        for task in st.session_state.tasks:
-            if task['id'] == task_id:
-                task['text'] = new_text
-        self._save_tasks()
+        if task_id in st.session_state.tasks:
+            self._record({'op': 'update', 'id': task_id, 'fields': {'text': new_text}})
 
     def get_efficiency_metrics(self):
-        """Calculate efficiency metrics"""
-        total_tasks = len(st.session_state.tasks)
-        completed_tasks = sum(1 for task in st.session_state.tasks if task['completed'])
+        """Read efficiency metrics from the store's aggregate queries, or from the running counters"""
+        counters = self.store.counters() if hasattr(self.store, 'counters') else st.session_state.task_counters
+        total_tasks = counters.total
+        completed_tasks = counters.completed
         
         completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
         return {
             'total_tasks': total_tasks,
             'completed_tasks': completed_tasks,
-            'completion_rate': round(completion_rate, 2)
+            'completion_rate': round(completion_rate, 2),
+            'window_completion_rates': counters.window_rates()
         }
 
 def main():
@@ -100,6 +496,19 @@ def main():
     with col3:
         st.metric(label="Completion Rate", value=f"{metrics['completion_rate']}%")
 
+    # Rolling completion rates
+    window_rates = metrics['window_completion_rates']
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(label="Last Day", value=f"{window_rates['day']}%")
+    
+    with col2:
+        st.metric(label="Last Week", value=f"{window_rates['week']}%")
+    
+    with col3:
+        st.metric(label="Last Month", value=f"{window_rates['month']}%")
+
     # Task Input
     with st.form(key='task_form'):
         task_input = st.text_input("Enter a new task")
@@ -107,13 +516,13 @@ def main():
         
         if submit_button and task_input:
             tracker.add_task(task_input)
-            st.experimental_rerun()
+            st.rerun()
 
     # Task List
     st.subheader("Your Tasks")
     
     if st.session_state.tasks:
-        for task in st.session_state.tasks:
+        for task in list(st.session_state.tasks.values()):
             col1, col2, col3 = st.columns([0.1, 0.7, 0.2])
             
             with col1:
@@ -143,7 +552,7 @@ def main():
                 # Delete button
                 if st.button('Delete', key=f"task_{task['id']}_delete"):
                     tracker.delete_task(task['id'])
-                    st.experimental_rerun()
+                    st.rerun()
 
     else:
         st.info("No tasks yet. Add a task to get started!")
@@ -153,5 +562,5 @@ if __name__ == "__main__":
 
 # Optional: requirements.txt content
 """
-streamlit==1.29.0
+streamlit>=1.37.0
 """
@@ -0,0 +1,283 @@
+import argparse
+import itertools
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scoring import calculate_category_score, calculate_effectiveness_score, calculate_efficiency_score, calculate_overall_efficiency
+
+# Batch bodies up to this size are scored in the request thread; larger ones become worker pool jobs
+INLINE_BATCH_BYTES = int(os.environ.get("SCORING_INLINE_BATCH_BYTES", 256 * 1024))
+MAX_BODY_BYTES = int(os.environ.get("SCORING_MAX_BODY_BYTES", 64 * 1024 * 1024))
+MAX_JOBS = 1000
+# Score inputs beyond this magnitude are rejected, so no score can overflow to inf or raise OverflowError
+MAX_FIELD_VALUE = 1e15
+LATENCY_WINDOW = 10000
+
+QUALITATIVE_FIELDS = ["communication", "transparency", "responsiveness", "policy_impact", "citizen_satisfaction"]
+EFFICIENCY_FIELDS = ["employees", "budget", "utilization", "oversight", "num_regulations", "economic_oversight"]
+
+# Request Scoring
+def number_fields(request, fields):
+    """Numeric request fields by name; a missing, non-numeric, non-finite or out-of-range field is a ValueError"""
+    if not isinstance(request, dict):
+        raise ValueError("each request must be a JSON object")
+    values = {}
+    for field in fields:
+        value = request.get(field)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"'{field}' must be a number")
+        # NaN fails every comparison, so this also rejects NaN and Infinity
+        if not -MAX_FIELD_VALUE <= value <= MAX_FIELD_VALUE:
+            raise ValueError(f"'{field}' must be a finite number between {-MAX_FIELD_VALUE:g} and {MAX_FIELD_VALUE:g}")
+        values[field] = value
+    return values
+
+def score_effectiveness(request):
+    return {"effectiveness_score": calculate_effectiveness_score(**number_fields(request, QUALITATIVE_FIELDS))}
+
+def score_efficiency(request):
+    """Efficiency score from an effectiveness_score, or from the five qualitative ratings"""
+    values = number_fields(request, EFFICIENCY_FIELDS)
+    if values["employees"] <= 0:
+        raise ValueError("'employees' must be positive")
+    if "effectiveness_score" in request:
+        effectiveness_score = number_fields(request, ["effectiveness_score"])["effectiveness_score"]
+    else:
+        effectiveness_score = score_effectiveness(request)["effectiveness_score"]
+    return {
+        "efficiency_score": calculate_efficiency_score(effectiveness_score=effectiveness_score, **values),
+        "effectiveness_score": effectiveness_score
+    }
+
+def score_categories(request):
+    """Category totals and overall efficiency from {"categories": {category: {metric: value}}}"""
+    categories = request.get("categories") if isinstance(request, dict) else None
+    if not isinstance(categories, dict) or not categories:
+        raise ValueError("'categories' must be a non-empty object of category metrics")
+    category_scores = {
+        category: calculate_category_score(number_fields(metrics, list(metrics) if isinstance(metrics, dict) else []))
+        for category, metrics in categories.items()
+    }
+    return {"category_scores": category_scores, "overall_efficiency": calculate_overall_efficiency(category_scores)}
+
+SCORERS = {
+    "efficiency": score_efficiency,
+    "effectiveness": score_effectiveness,
+    "categories": score_categories
+}
+
+def score_items(kind, items):
+    """Score a list of requests; a bad item gets an error entry instead of failing the batch"""
+    scorer = SCORERS[kind]
+    results = []
+    for item in items:
+        try:
+            results.append(scorer(item))
+        except (ValueError, TypeError, ZeroDivisionError) as e:
+            results.append({"error": str(e)})
+    return results
+
+def batch_items(request):
+    items = request.get("items") if isinstance(request, dict) else None
+    if not isinstance(items, list):
+        raise ValueError("'items' must be a list of score requests")
+    return items
+
+def score_batch(kind, body):
+    """Worker pool job: decode, score and encode a heavy batch, so the JSON work stays off the server's threads"""
+    items = batch_items(json.loads(body))
+    return len(items), json.dumps(score_items(kind, items)).encode("utf-8")
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+# Service State
+class ScoringService:
+    """Worker pool, batch jobs and per-route latency windows shared by the request threads"""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.lock = threading.Lock()
+        self.jobs = OrderedDict()
+        self.job_ids = itertools.count(1)
+        self.latencies = {}
+        self.started = time.time()
+
+    def record(self, route, seconds):
+        with self.lock:
+            window = self.latencies.get(route)
+            if window is None:
+                window = self.latencies[route] = deque(maxlen=LATENCY_WINDOW)
+            window.append(seconds)
+
+    def submit(self, kind, body):
+        """Hand a heavy batch body to the worker pool and return its job id"""
+        submitted = time.perf_counter()
+        future = self.pool.submit(score_batch, kind, body)
+        with self.lock:
+            job_id = str(next(self.job_ids))
+            self.jobs[job_id] = {"kind": kind, "future": future}
+            # Keep a bounded number of jobs, dropping the oldest finished ones first
+            while len(self.jobs) > MAX_JOBS:
+                oldest = next((key for key, job in self.jobs.items() if job["future"].done()), None)
+                if oldest is None:
+                    break
+                del self.jobs[oldest]
+        future.add_done_callback(lambda _: self.record(f"job:{kind}", time.perf_counter() - submitted))
+        return job_id
+
+    def job_status(self, job_id):
+        """Job status as a dict, or as JSON bytes with the results the worker already encoded"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        status = {"job": job_id, "kind": job["kind"]}
+        if not job["future"].done():
+            return dict(status, status="pending")
+        try:
+            items, results = job["future"].result()
+        except Exception as e:
+            return dict(status, status="failed", error=str(e))
+        header = json.dumps(dict(status, status="done", items=items)).encode("utf-8")
+        return header[:-1] + b', "results": ' + results + b"}"
+
+    def stats(self):
+        with self.lock:
+            windows = {route: list(window) for route, window in self.latencies.items()}
+            pending = sum(1 for job in self.jobs.values() if not job["future"].done())
+        routes = {
+            route: {
+                "count": len(window),
+                "p50_ms": percentile(window, 0.50) * 1000,
+                "p95_ms": percentile(window, 0.95) * 1000,
+                "p99_ms": percentile(window, 0.99) * 1000,
+                "max_ms": max(window) * 1000
+            }
+            for route, window in windows.items()
+        }
+        return {"uptime_s": time.time() - self.started, "workers": self.workers, "pending_jobs": pending, "routes": routes}
+
+# HTTP Handler
+class ScoringHandler(BaseHTTPRequestHandler):
+    """JSON routes: POST /score/<kind>, POST /batch/<kind>, GET /jobs/<id>, GET /stats, GET /health"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY each keep-alive response waits on a delayed ACK
+    disable_nagle_algorithm = True
+    service = None
+    log_requests = False
+
+    def send_json(self, status, payload):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self):
+        header = (self.headers.get("Content-Length") or "0").strip()
+        if not (header.isascii() and header.isdigit()):
+            # Without a usable length the body cannot be skipped, so the connection is closed
+            self.close_connection = True
+            raise ValueError(f"invalid Content-Length {header!r}")
+        length = int(header)
+        if length > MAX_BODY_BYTES:
+            raise OverflowError(f"request body is larger than {MAX_BODY_BYTES} bytes")
+        return self.rfile.read(length) or b"null"
+
+    def timed(self, handle):
+        """Run a route and record its latency under the path without the id"""
+        start = time.perf_counter()
+        parts = self.path.split("?")[0].strip("/").split("/")
+        route = "/" + "/".join(parts[:1] if parts[0] == "jobs" else parts[:2])
+        try:
+            status, payload = handle(parts)
+        except OverflowError as e:
+            # The unread body would be taken for the next request, so the connection is closed
+            self.close_connection = True
+            status, payload = 413, {"error": str(e)}
+        except (ValueError, TypeError) as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            # Anything else (e.g. RecursionError from a deeply nested body) is a server error; the
+            # body may be partly read, so the connection is closed
+            traceback.print_exc(file=sys.stderr)
+            self.close_connection = True
+            status, payload = 500, {"error": f"internal error: {type(e).__name__}"}
+        if status == 404 and parts[0] != "jobs":
+            # Unknown paths share one entry so they cannot grow the latency table
+            route = "/unmatched"
+        self.send_json(status, payload)
+        self.service.record(f"{self.command} {route}", time.perf_counter() - start)
+
+    def do_GET(self):
+        self.timed(self.route_get)
+
+    def do_POST(self):
+        self.timed(self.route_post)
+
+    def route_get(self, parts):
+        if parts == ["health"]:
+            return 200, {"status": "ok"}
+        if parts == ["stats"]:
+            return 200, self.service.stats()
+        if len(parts) == 2 and parts[0] == "jobs":
+            status = self.service.job_status(parts[1])
+            return (404, {"error": f"unknown job {parts[1]}"}) if status is None else (200, status)
+        return 404, {"error": f"no route for GET {self.path}"}
+
+    def route_post(self, parts):
+        # The body is read first so a keep-alive connection stays in step even for unknown routes
+        body = self.read_body()
+        if len(parts) != 2 or parts[0] not in ("score", "batch") or parts[1] not in SCORERS:
+            return 404, {"error": f"no route for POST {self.path}"}
+        if parts[0] == "score":
+            return 200, SCORERS[parts[1]](json.loads(body))
+        if len(body) <= INLINE_BATCH_BYTES:
+            return 200, {"results": score_items(parts[1], batch_items(json.loads(body)))}
+        job_id = self.service.submit(parts[1], body)
+        return 202, {"job": job_id, "status_url": f"/jobs/{job_id}"}
+
+    def log_message(self, format, *args):
+        if self.log_requests:
+            super().log_message(format, *args)
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP API for the efficiency, effectiveness and category scores")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600, help="0 picks a free port")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("SCORING_WORKERS", os.cpu_count() or 1)))
+    parser.add_argument("--log-requests", action="store_true")
+    args = parser.parse_args()
+
+    ScoringHandler.service = ScoringService(args.workers)
+    ScoringHandler.log_requests = args.log_requests
+    server = ThreadingHTTPServer((args.host, args.port), ScoringHandler)
+    server.daemon_threads = True
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    host, port = server.server_address[:2]
+    print(f"Serving scores on http://{host}:{port} with {args.workers} workers", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        ScoringHandler.service.pool.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+# Scoring Functions
+# Shared by the apps and scoring-api.py, so the API scores departments exactly as the UI does
+def calculate_efficiency_score(employees, budget, utilization, oversight, num_regulations, economic_oversight, effectiveness_score):
+    """Calculate department efficiency score."""
+    score = (
+        (utilization * 0.3) +
+        ((100 - oversight) * 0.2) +
+        (min(2000 / employees, 100) * 0.2) +
+        (max(100 - num_regulations * 2, 0) * 0.15) +
+        (100 - economic_oversight * 0.15) +
+        (effectiveness_score * 0.5)
+    )
+    return min(score / 1.5, 100)
+
+def calculate_effectiveness_score(communication, transparency, responsiveness, policy_impact, citizen_satisfaction):
+    """Calculate effectiveness score based on qualitative metrics."""
+    return (communication + transparency + responsiveness + policy_impact + citizen_satisfaction) / 5 * 20
+
+def calculate_category_score(metrics):
+    return sum(metrics.values())
+
+def calculate_overall_efficiency(category_scores):
+    return sum(category_scores.values()) / len(category_scores)
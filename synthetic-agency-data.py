@@ -0,0 +1,220 @@
+import argparse
+import gzip
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Rows are generated in fixed chunks; each chunk and column has its own seeded stream, so a run
+# with the same seed is identical and a smaller run is always the head of a larger one
+CHUNK_ROWS = 100000
+CABINET_EVERY = 25
+
+# Categories from the agency dataset ("downloaded_data (5).csv")
+CATEGORIES = [
+    "Administrative", "Agriculture", "Business", "Commerce", "Communications", "Defense", "Development",
+    "Education", "Emergency Management", "Energy", "Engineering", "Environmental", "Executive", "Facilities",
+    "Finance", "Foreign Affairs", "Health", "Housing", "Intelligence", "Interior", "International", "Justice",
+    "Labor", "Land Management", "Law Enforcement", "Legal", "Mail", "Memorial", "Native Affairs", "Oversight",
+    "Parks", "Personnel", "Records", "Regulatory", "Science", "Security", "Social Services", "Space",
+    "Statistics", "Transportation", "Veterans"
+]
+NAME_PREFIXES = ["Bureau of", "Office of", "Administration for", "Commission on", "Agency for", "Service for", "Board of", "Center for"]
+
+# Agency types other than Cabinet Department, weighted roughly like the agency dataset
+AGENCY_TYPES = ["Sub-Agency", "Independent Agency", "Military Service", "Government Corporation", "Legislative Branch Agency", "Judicial Branch", "Executive Office"]
+AGENCY_TYPE_WEIGHTS = [0.55, 0.30, 0.05, 0.04, 0.03, 0.015, 0.015]
+TYPES_WITH_PARENT = {"Sub-Agency", "Military Service"}
+
+EFFICIENCY_CATEGORIES = ["Operational Efficiency", "Fiscal Efficiency", "Administrative Efficiency", "Public Service Efficiency"]
+QUALITATIVE_METRICS = ["Communication", "Transparency", "Responsiveness", "Policy Impact", "Citizen Satisfaction"]
+
+FORMATS = {".csv": "csv", ".json": "json", ".xml": "xml", ".parquet": "parquet"}
+
+# Row Generation
+def column_rng(seed, chunk_index, column):
+    return np.random.default_rng([seed, chunk_index, column])
+
+def initials(text):
+    return "".join(word[0] for word in text.split() if word[0].isupper())
+
+def labels(values, table):
+    """Look up `values` in `table` as a Python object array, so labels concatenate element-wise"""
+    return np.array(table, dtype=object)[values]
+
+def generate_chunk(seed, chunk_index, rows, metrics=True):
+    """One chunk of agency rows as a DataFrame; row numbers continue across chunks"""
+    start = chunk_index * CHUNK_ROWS
+    row_numbers = np.arange(start, start + rows)
+    row_labels = (row_numbers + 1).astype(str).astype(object)
+    is_cabinet = row_numbers % CABINET_EVERY == 0
+
+    types = labels(column_rng(seed, chunk_index, 0).choice(len(AGENCY_TYPES), rows, p=AGENCY_TYPE_WEIGHTS), AGENCY_TYPES)
+    # Sub-agencies report to a cabinet department that has already been generated
+    parents = (column_rng(seed, chunk_index, 1).random(rows) * (row_numbers // CABINET_EVERY + 1)).astype(np.int64)
+    topics = column_rng(seed, chunk_index, 2).integers(0, len(CATEGORIES), rows)
+    prefixes = column_rng(seed, chunk_index, 3).integers(0, len(NAME_PREFIXES), rows)
+
+    # Cabinet departments are "Department of <Category> <n>"; "Parent Department" holds the short
+    # "<Category> <n>" form, as the agency dataset does ("Health", "Interior", ...)
+    cabinets = row_numbers // CABINET_EVERY
+    cabinet_topics = cabinets % len(CATEGORIES)
+    parent_topics = parents % len(CATEGORIES)
+    has_parent = ~is_cabinet & np.isin(types, list(TYPES_WITH_PARENT))
+    parent_names = labels(parent_topics, CATEGORIES) + " " + (parents + 1).astype(str).astype(object)
+
+    names = np.where(
+        is_cabinet,
+        "Department of " + labels(cabinet_topics, CATEGORIES) + " " + (cabinets + 1).astype(str).astype(object),
+        labels(prefixes, NAME_PREFIXES) + " " + labels(topics, CATEGORIES) + " " + row_labels
+    )
+    name_initials = [[initials(f"{prefix} {category}") for category in CATEGORIES] for prefix in NAME_PREFIXES]
+    acronyms = np.where(
+        is_cabinet,
+        "D" + labels(cabinet_topics, [initials(category) for category in CATEGORIES]) + row_labels,
+        np.array(name_initials, dtype=object)[prefixes, topics] + row_labels
+    )
+
+    chunk = pd.DataFrame({
+        "department_name": names,
+        "Type": np.where(is_cabinet, "Cabinet Department", types),
+        "Parent Department": np.where(has_parent, parent_names, ""),
+        "Category": labels(np.where(is_cabinet, cabinet_topics, np.where(has_parent, parent_topics, topics)), CATEGORIES),
+        "Acronym": acronyms
+    })
+    if not metrics:
+        return chunk
+
+    chunk["Employees"] = np.maximum(column_rng(seed, chunk_index, 10).lognormal(7.5, 1.5, rows).astype(np.int64), 1)
+    chunk["Budget (Million USD)"] = np.round(column_rng(seed, chunk_index, 11).lognormal(5.0, 1.8, rows), 2)
+    chunk["Budget Utilization (%)"] = np.clip(column_rng(seed, chunk_index, 12).normal(78, 12, rows), 0, 100).astype(np.int64)
+    chunk["Regulatory Oversight (%)"] = column_rng(seed, chunk_index, 13).integers(0, 101, rows)
+    chunk["Economic Oversight (%)"] = column_rng(seed, chunk_index, 14).integers(0, 101, rows)
+    chunk["Regulations"] = column_rng(seed, chunk_index, 15).poisson(12, rows)
+    for offset, metric in enumerate(QUALITATIVE_METRICS):
+        chunk[metric] = column_rng(seed, chunk_index, 20 + offset).integers(1, 6, rows)
+    for offset, category in enumerate(EFFICIENCY_CATEGORIES):
+        # Four 0-25 slider metrics per category, as in the assessment apps
+        chunk[category] = column_rng(seed, chunk_index, 30 + offset).integers(0, 26, (rows, 4)).sum(axis=1)
+    return chunk
+
+def generate_chunks(rows, seed, metrics=True):
+    """Yield DataFrames of at most CHUNK_ROWS rows until `rows` rows have been produced"""
+    for chunk_index, start in enumerate(range(0, rows, CHUNK_ROWS)):
+        yield generate_chunk(seed, chunk_index, min(CHUNK_ROWS, rows - start), metrics)
+
+# Streaming Writers
+XML_ENTITIES = [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")]
+
+def xml_tag(column):
+    """XML element name for a column: "Budget (Million USD)" -> "Budget_Million_USD" """
+    return re.sub(r"[^0-9A-Za-z]+", "_", column).strip("_")
+
+def write_csv(chunks, output):
+    for index, chunk in enumerate(chunks):
+        chunk.to_csv(output, header=index == 0, index=False)
+
+def write_json(chunks, output):
+    """One JSON array of records, as json.load followed by pd.DataFrame expects"""
+    output.write("[")
+    for index, chunk in enumerate(chunks):
+        records = chunk.to_json(orient="records", force_ascii=False)[1:-1]
+        if records:
+            output.write(("," if index else "") + "\n" + records)
+    output.write("\n]\n")
+
+def write_xml(chunks, output):
+    """<Agencies> with one <Agency> per row and one child element per column"""
+    output.write('<?xml version="1.0" encoding="utf-8"?>\n<Agencies>\n')
+    for chunk in chunks:
+        # Elements are built a column at a time rather than a row at a time
+        elements = pd.Series("<Agency>", index=chunk.index, dtype=object)
+        for column in chunk.columns:
+            values = chunk[column].astype(str)
+            if not pd.api.types.is_numeric_dtype(chunk[column]):
+                for character, entity in XML_ENTITIES:
+                    values = values.str.replace(character, entity, regex=False)
+            tag = xml_tag(column)
+            elements = elements + f"<{tag}>" + values + f"</{tag}>"
+        output.write("".join(elements + "</Agency>\n"))
+    output.write("</Agencies>\n")
+
+def write_parquet(chunks, path):
+    """One Parquet row group per chunk through a single pyarrow writer"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("Parquet output requires pyarrow (pip install pyarrow)")
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+WRITERS = {"csv": write_csv, "json": write_json, "xml": write_xml}
+
+def output_format(path, requested):
+    if requested:
+        return requested
+    if path == "-":
+        return "csv"
+    base = path[:-3] if path.endswith(".gz") else path
+    extension = os.path.splitext(base)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"cannot infer a format from {path!r}; pass --format")
+    return FORMATS[extension]
+
+def write_dataset(path, rows, seed=42, file_format=None, metrics=True):
+    """Stream `rows` synthetic agencies to `path` ("-" for stdout); a .gz suffix compresses text formats"""
+    file_format = output_format(path, file_format)
+    chunks = generate_chunks(rows, seed, metrics)
+    if file_format == "parquet":
+        if path == "-":
+            raise ValueError("Parquet output needs a file path")
+        write_parquet(chunks, path)
+    elif path == "-":
+        WRITERS[file_format](chunks, sys.stdout)
+    elif path.endswith(".gz"):
+        with gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=6) as output:
+            WRITERS[file_format](chunks, output)
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as output:
+            WRITERS[file_format](chunks, output)
+    return file_format
+
+def main():
+    parser = argparse.ArgumentParser(description="Seeded synthetic agency datasets for scale testing the loaders and scorers")
+    parser.add_argument("output", help="File to write (.csv, .json, .xml, .parquet, optionally .gz for text formats) or - for stdout")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())))
+    parser.add_argument("--schema-only", action="store_true", help="Only the agency dataset columns, without assessment metrics")
+    args = parser.parse_args()
+    if args.rows < 1:
+        parser.error("--rows must be at least 1")
+
+    start = time.perf_counter()
+    try:
+        file_format = write_dataset(args.output, args.rows, args.seed, args.format, not args.schema_only)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+    if args.output != "-":
+        size = os.path.getsize(args.output)
+        print(
+            f"Wrote {args.rows:,} rows as {file_format} to {args.output} "
+            f"({size / 1024 / 1024:,.1f} MiB, {elapsed:.1f} s, {args.rows / max(elapsed, 1e-9):,.0f} rows/s)",
+            file=sys.stderr
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "efficiencycalculator.py")
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # The JSON task store writes tasks.json and tasks.journal to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("TASK_STORE_BACKEND", raising=False)
+    st.cache_resource.clear()
+    yield AppTest.from_file(APP_PATH, default_timeout=30).run()
+    st.cache_resource.clear()
+
+def add_task(at, text):
+    at.text_input[0].input(text)
+    at.button[0].click().run()
+
+def test_add_and_delete_task(app):
+    assert not app.exception
+    assert app.info[0].value.startswith("No tasks yet")
+
+    add_task(app, "Review budget")
+    assert not app.exception
+    assert [task["text"] for task in app.session_state.tasks.values()] == ["Review budget"]
+    assert app.metric[0].value == "1"
+
+    delete_buttons = [button for button in app.button if button.label == "Delete"]
+    assert len(delete_buttons) == 1
+    delete_buttons[0].click().run()
+    assert not app.exception
+    assert not app.session_state.tasks
+    assert app.metric[0].value == "0"
+    assert app.info[0].value.startswith("No tasks yet")
+
+def test_sqlite_sessions_see_each_others_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("TASK_STORE_BACKEND", "sqlite")
+    st.cache_resource.clear()
+    try:
+        first = AppTest.from_file(APP_PATH, default_timeout=30).run()
+        second = AppTest.from_file(APP_PATH, default_timeout=30).run()
+
+        add_task(first, "Review budget")
+        second.run()
+        assert not second.exception
+        assert [task["text"] for task in second.session_state.tasks.values()] == ["Review budget"]
+        assert second.metric[0].value == "1"
+
+        # A write from a session that missed a change reloads instead of keeping a stale list
+        add_task(second, "Audit contracts")
+        add_task(first, "Close tickets")
+        assert [task["text"] for task in first.session_state.tasks.values()] == ["Review budget", "Audit contracts", "Close tickets"]
+        assert first.metric[0].value == "3"
+    finally:
+        st.cache_resource.clear()
+
+def test_journal_sessions_apply_missed_changes_before_their_own(app):
+    other = AppTest.from_file(APP_PATH, default_timeout=30).run()
+    add_task(app, "Review budget")
+    add_task(other, "Audit contracts")
+    assert not other.exception
+    # The second session caught up with the first one's task before appending its own
+    assert [task["text"] for task in other.session_state.tasks.values()] == ["Review budget", "Audit contracts"]
+    assert other.metric[0].value == "2"
+
+    reloaded = AppTest.from_file(APP_PATH, default_timeout=30).run()
+    assert list(reloaded.session_state.tasks.values()) == list(other.session_state.tasks.values())
@@ -0,0 +1,65 @@
+import gzip
+import importlib.util
+import os
+
+import pandas as pd
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+spec = importlib.util.spec_from_file_location("doge_appv5_1", os.path.join(REPO_DIR, "doge-appv5-1.py"))
+app = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(app)
+
+def sample_record(index):
+    template = app.get_efficiency_category_template()
+    detailed_metrics = {
+        category: {metric: (index + position) % 26 for position, metric in enumerate(metrics)}
+        for category, metrics in template.items()
+    }
+    return {
+        "Department Name": f"Department {index}",
+        "Employees": 100 + index,
+        "Regulations": "Regulation 1, Regulation 2",
+        "Budget (Million USD)": 10.5 + index,
+        "Budget Utilization (%)": 80,
+        "Regulatory Oversight (%)": 20,
+        "Economic Oversight (%)": 10,
+        "Effectiveness Score": 60.0,
+        "Category Scores": {category: sum(values.values()) for category, values in detailed_metrics.items()},
+        "Detailed Metrics": detailed_metrics
+    }
+
+def assert_scores(loaded, records):
+    flat = [app.flatten_export_data(record) for record in records]
+    score_columns = [column for column in flat[0] if "." in column]
+    assert loaded[score_columns].to_dict("records") == [
+        {column: row[column] for column in score_columns} for row in flat
+    ]
+
+def test_flattened_csv_keeps_unknown_dotted_columns():
+    records = [sample_record(index) for index in range(3)]
+    flat = pd.DataFrame([app.flatten_export_data(record) for record in records])
+    flat["Budget (v1.2)"] = 7
+
+    loaded, rejected = app.load_export_records(app.convert_to_csv(flat), "CSV")
+    assert rejected == 0
+    assert loaded["Budget (v1.2)"].tolist() == [7, 7, 7]
+    assert_scores(loaded, records)
+
+@pytest.mark.parametrize("file_format", ["JSON", "XML", "CSV"])
+def test_nested_exports_load_as_flat_score_columns(file_format):
+    records = [sample_record(index) for index in range(3)]
+    if file_format == "JSON":
+        content = app.convert_to_json(records)
+    elif file_format == "XML":
+        content = app.convert_to_xml(records)
+    else:
+        # Older CSV exports wrote each nested dict into a single cell
+        content = app.convert_to_csv(pd.DataFrame(records))
+
+    loaded, rejected = app.load_export_records(gzip.compress(content), file_format, "gz")
+    assert rejected == 0
+    assert loaded["Department Name"].tolist() == [record["Department Name"] for record in records]
+    assert not set(app.NESTED_EXPORT_COLUMNS) & set(loaded.columns)
+    assert_scores(loaded, records)
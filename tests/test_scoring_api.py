@@ -0,0 +1,86 @@
+import http.client
+import importlib.util
+import json
+import os
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+spec = importlib.util.spec_from_file_location("scoring_api", os.path.join(REPO_DIR, "scoring-api.py"))
+scoring_api = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(scoring_api)
+
+EFFICIENCY_REQUEST = {
+    "employees": 500, "budget": 50, "utilization": 80, "oversight": 20, "num_regulations": 3, "economic_oversight": 10,
+    "effectiveness_score": 60
+}
+
+@pytest.fixture(scope="module")
+def server():
+    scoring_api.ScoringHandler.service = scoring_api.ScoringService(workers=1)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), scoring_api.ScoringHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+    scoring_api.ScoringHandler.service.pool.shutdown()
+
+def post(address, path, body, headers=None):
+    connection = http.client.HTTPConnection(*address, timeout=5)
+    try:
+        connection.request("POST", path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read()), response.getheader("Connection")
+    finally:
+        connection.close()
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf"), 10 ** 400, 1e16])
+def test_number_fields_rejects_non_finite_and_out_of_range(value):
+    with pytest.raises(ValueError, match="'employees' must be a finite number"):
+        scoring_api.score_efficiency(dict(EFFICIENCY_REQUEST, employees=value))
+
+def test_batch_reports_out_of_range_items_per_item():
+    results = scoring_api.score_items("efficiency", [EFFICIENCY_REQUEST, dict(EFFICIENCY_REQUEST, budget=10 ** 400)])
+    assert "efficiency_score" in results[0]
+    assert "must be a finite number" in results[1]["error"]
+
+@pytest.mark.parametrize("raw", ["NaN", "Infinity", "1" + "0" * 400])
+def test_score_route_rejects_non_finite_and_huge_numbers(server, raw):
+    body = json.dumps(EFFICIENCY_REQUEST).replace('"budget": 50', f'"budget": {raw}')
+    status, payload, _ = post(server, "/score/efficiency", body, {"Content-Type": "application/json"})
+    assert status == 400
+    assert "'budget' must be a finite number" in payload["error"]
+
+@pytest.mark.parametrize("length", ["-1", "abc", "1_0"])
+def test_invalid_content_length_is_a_bad_request(server, length):
+    status, payload, connection = post(server, "/score/efficiency", None, {"Content-Length": length})
+    assert status == 400
+    assert "invalid Content-Length" in payload["error"]
+    assert connection == "close"
+
+def test_unexpected_errors_are_a_server_error_with_latency_recorded(server):
+    # json.loads raises RecursionError on a deeply nested body
+    status, payload, connection = post(server, "/score/efficiency", "[" * 100000)
+    assert status == 500
+    assert payload["error"] == "internal error: RecursionError"
+    assert connection == "close"
+
+    connection = http.client.HTTPConnection(*server, timeout=5)
+    try:
+        connection.request("GET", "/stats")
+        stats = json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+    assert stats["routes"]["POST /score/efficiency"]["count"] >= 1
+
+def test_api_scores_with_the_apps_functions():
+    spec = importlib.util.spec_from_file_location("doge_appv4", os.path.join(REPO_DIR, "doge-appv4.py"))
+    app = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(app)
+    assert app.calculate_category_score is scoring_api.calculate_category_score
+    assert app.calculate_overall_efficiency is scoring_api.calculate_overall_efficiency